@@ -3,21 +3,30 @@ API endpoints for managing chunks
 """
 
 import logging
+import orjson
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from uuid import UUID
 
 from app.schemas.chunk import (
     ChunkCreate, ChunkUpdate, ChunkResponse, ChunkListResponse,
     ChunkBulkCreate, ChunkSearchRequest, ChunkSearchResponse,
-    ChunkBatchToggleRequest, ChunkBatchToggleResponse
+    ChunkBatchToggleRequest, ChunkBatchToggleResponse, CHUNK_CREATE_LIST_ADAPTER
 )
 from app.utils.auth import get_current_user
+from app.utils.request_body import json_body, json_body_openapi
+from app.services.vapi_assistant import delete_file_from_vapi, upload_chunk_to_vapi, sync_assistant_prompt
 from app.database_operations import get_supabase_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Chunks Management"])
 
+# ChunkResponse columns and the values it would fill in for ones a row lacks
+_CHUNK_FIELD_DEFAULTS = {
+    name: None if field.is_required() else field.default
+    for name, field in ChunkResponse.model_fields.items()
+}
+
 @router.get("/chunks", response_model=ChunkListResponse)
 async def get_chunks(
     page: int = Query(1, ge=1, description="Page number"),
@@ -70,12 +79,22 @@ async def get_chunks(
         
         logger.info(f"Retrieved {len(result.data)} chunks for organization {organization_id}")
         
-        return ChunkListResponse(
-            chunks=[ChunkResponse(**chunk) for chunk in result.data],
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+        # A page can hold thousands of rows; project them onto ChunkResponse and
+        # encode in one orjson pass instead of validating each row (response_model
+        # stays for the docs)
+        chunks = [
+            {name: row.get(name, default) for name, default in _CHUNK_FIELD_DEFAULTS.items()}
+            for row in result.data
+        ]
+        return Response(
+            content=orjson.dumps({
+                "chunks": chunks,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages,
+            }),
+            media_type="application/json",
         )
         
     except Exception as e:
@@ -104,7 +123,7 @@ async def get_chunk(
         if not result.data:
             raise HTTPException(status_code=404, detail="Chunk not found")
         
-        return ChunkResponse(**result.data[0])
+        return result.data[0]
         
     except HTTPException:
         raise
@@ -149,8 +168,6 @@ async def update_chunk(
         vapi_file_id = existing.data.get("vapi_file_id")
         if vapi_file_id:
             try:
-                from app.services.vapi_assistant import delete_file_from_vapi, upload_chunk_to_vapi, sync_assistant_prompt
-                
                 # Delete old file from VAPI
                 await delete_file_from_vapi(vapi_file_id)
                 
@@ -182,7 +199,7 @@ async def update_chunk(
                 # Continue - database update was successful
         
         logger.info(f"Updated chunk {chunk_id}")
-        return ChunkResponse(**updated_chunk)
+        return updated_chunk
         
     except HTTPException:
         raise
@@ -218,7 +235,6 @@ async def delete_chunk(
         # Delete file from VAPI if it exists
         if vapi_file_id:
             try:
-                from app.services.vapi_assistant import delete_file_from_vapi, sync_assistant_prompt
                 await delete_file_from_vapi(vapi_file_id)
                 logger.info(f"Deleted VAPI file {vapi_file_id} for chunk {chunk_id}")
             except Exception as vapi_error:
@@ -237,7 +253,6 @@ async def delete_chunk(
         # Sync assistant to remove from knowledge base
         if receptionist_id:
             try:
-                from app.services.vapi_assistant import sync_assistant_prompt
                 rec_row = supabase.table("receptionists").select("assistant_id").eq("id", receptionist_id).single().execute()
                 assistant_id = rec_row.data.get("assistant_id") if rec_row.data else None
                 if assistant_id:
@@ -271,14 +286,11 @@ async def create_chunks_bulk(
         if not organization_id:
             raise HTTPException(status_code=400, detail="User has no organization")
         
-        # Prepare chunks data
-        chunks_data = []
-        for chunk in bulk_data.chunks:
-            chunk_dict = chunk.model_dump()
+        # Prepare chunks data (JSON mode so every value is ready for the insert payload)
+        chunks_data = CHUNK_CREATE_LIST_ADAPTER.dump_python(bulk_data.chunks, mode="json")
+        for chunk_dict in chunks_data:
             chunk_dict["organization_id"] = organization_id
-            chunk_dict["receptionist_id"] = bulk_data.receptionist_id
             chunk_dict["created_by_user_id"] = None  # Skip user tracking for now due to foreign key constraint
-            chunks_data.append(chunk_dict)
         
         # Insert chunks
         result = supabase.table("chunks").insert(chunks_data).execute()
@@ -287,15 +299,15 @@ async def create_chunks_bulk(
             raise HTTPException(status_code=500, detail="Failed to create chunks")
         
         logger.info(f"Created {len(result.data)} chunks for organization {organization_id}")
-        return [ChunkResponse(**chunk) for chunk in result.data]
+        return result.data
         
     except Exception as e:
         logger.error(f"Error creating chunks in bulk: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create chunks: {str(e)}")
 
-@router.post("/chunks/search", response_model=ChunkSearchResponse)
+@router.post("/chunks/search", response_model=ChunkSearchResponse, openapi_extra=json_body_openapi(ChunkSearchRequest))
 async def search_chunks(
-    search_request: ChunkSearchRequest,
+    search_request: ChunkSearchRequest = Depends(json_body(ChunkSearchRequest)),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -338,14 +350,14 @@ async def search_chunks(
         
         logger.info(f"Found {len(result.data)} chunks matching '{search_request.query}' for organization {organization_id}")
         
-        return ChunkSearchResponse(
-            chunks=[ChunkResponse(**chunk) for chunk in result.data],
-            total=total,
-            page=search_request.page,
-            page_size=search_request.page_size,
-            total_pages=total_pages,
-            query=search_request.query
-        )
+        return {
+            "chunks": result.data,
+            "total": total,
+            "page": search_request.page,
+            "page_size": search_request.page_size,
+            "total_pages": total_pages,
+            "query": search_request.query,
+        }
         
     except Exception as e:
         logger.error(f"Error searching chunks: {str(e)}")
@@ -366,8 +378,6 @@ async def batch_toggle_chunks(
     - Updates database and syncs assistant after all changes
     """
     try:
-        from app.services.vapi_assistant import upload_chunk_to_vapi, delete_file_from_vapi, sync_assistant_prompt
-        
         supabase = get_supabase_client()
         
         # Get user's organization
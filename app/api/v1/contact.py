@@ -13,19 +13,13 @@ router = APIRouter()
 @router.post("/", response_model=ContactResponse)
 async def contact_handler(form: ContactForm):
     """
-    Simple contact form handler that prints to console and returns the data
+    Simple contact form handler that logs the submission and returns the data
     """
-    # Print to console
-    print("=" * 50)
-    print("NEW CONTACT FORM SUBMISSION")
-    print("=" * 50)
-    print(f"Name: {form.name}")
-    print(f"Email: {form.email}")
-    print(f"Company: {form.company or 'N/A'}")
-    print(f"Subject: {form.subject or 'N/A'}")
-    print(f"Message: {form.message or 'N/A'}")
-    print(f"Channel: ['teams']")
-    print("=" * 50)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "New contact form submission: name=%s email=%s company=%s subject=%s message=%s",
+            form.name, form.email, form.company or 'N/A', form.subject or 'N/A', form.message or 'N/A',
+        )
     
     # Send Teams notification
     try:
@@ -64,10 +58,8 @@ async def contact_handler(form: ContactForm):
             response.raise_for_status()
         
         logger.info(f"Teams notification sent successfully for {form.name} ({form.email})")
-        print(f"✅ Teams notification sent successfully")
     except Exception as e:
         logger.error(f"Failed to send Teams notification: {e}")
-        print(f"❌ Error sending Teams notification: {e}")
     
     # Save to Supabase
     try:
@@ -86,10 +78,9 @@ async def contact_handler(form: ContactForm):
         }
         result = supabase.table(table_name).insert(data).execute()
         logger.info(f"Contact saved to Supabase table '{table_name}': {form.name} ({form.email})")
-        print(f"✅ Contact saved to Supabase table '{table_name}' with ID: {result.data[0]['id']}")
+        logger.debug("Contact row id: %s", result.data[0]['id'])
     except Exception as e:
         logger.error(f"Failed to save contact to Supabase: {e}")
-        print(f"❌ Error saving to Supabase: {e}")
     
     # Also log it
     logger.info(f"Contact form submitted by {form.name} ({form.email})")
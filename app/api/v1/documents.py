@@ -6,7 +6,8 @@ from fastapi.responses import JSONResponse
 
 from app.schemas.document import DocumentUploadResponse, DocumentInfo, DocumentChunkResponse, TextInputRequest
 from app.services.document_service import DocumentProcessingService
-from app.services.openai_service import OpenAIService
+from app.services.openai_service import get_openai_service
+from app.services.vapi_assistant import upload_chunks_to_vapi, sync_assistant_prompt
 from app.utils.auth import get_current_user
 from app.database import get_supabase_client
 from app.schemas.auth import UserResponse as User
@@ -73,7 +74,7 @@ async def process_document(
         
         # Initialize services
         document_service = DocumentProcessingService()
-        openai_service = OpenAIService()
+        openai_service = get_openai_service()
         supabase = get_supabase_client()
         
         # Process document and extract text
@@ -123,31 +124,9 @@ async def process_document(
             raise HTTPException(status_code=500, detail=f"Failed to save chunks to database: {str(e)}")
         
         # Upload chunks to VAPI as files and update vapi_file_id
-        from app.services.vapi_assistant import upload_chunk_to_vapi, sync_assistant_prompt
-        for saved_chunk in saved_chunks:
-            try:
-                chunk_id = saved_chunk.get('id')
-                chunk_name = saved_chunk.get('name', 'Unnamed Chunk')
-                chunk_content = saved_chunk.get('content', '')
-                bullets = saved_chunk.get('bullets', [])
-                sample_questions = saved_chunk.get('sample_questions', [])
-                
-                # Upload to VAPI with complete information
-                vapi_file_id = await upload_chunk_to_vapi(
-                    chunk_id, 
-                    chunk_name, 
-                    chunk_content,
-                    bullets=bullets,
-                    sample_questions=sample_questions
-                )
-                
-                # Update chunk with vapi_file_id
-                if vapi_file_id:
-                    supabase.table("chunks").update({"vapi_file_id": vapi_file_id}).eq("id", chunk_id).execute()
-                    logger.info(f"Updated chunk {chunk_id} with VAPI file ID: {vapi_file_id}")
-            except Exception as upload_error:
-                logger.warning(f"Failed to upload chunk {chunk_id} to VAPI: {str(upload_error)}")
-                # Continue with other chunks
+        if saved_chunks:
+            uploaded = await upload_chunks_to_vapi(saved_chunks)
+            logger.info(f"Uploaded {uploaded}/{len(saved_chunks)} chunks to VAPI")
         
         # Sync assistant with updated knowledge base file IDs
         if receptionist_id:
@@ -253,7 +232,7 @@ async def get_supported_formats():
         
         # Initialize services
         document_service = DocumentProcessingService()
-        openai_service = OpenAIService()
+        openai_service = get_openai_service()
         
         # Process document and extract text
         document_result = await document_service.process_document(file)
@@ -371,7 +350,7 @@ async def process_text(
         logger.info(f"Starting text processing for '{request.name}' by user {user_email}")
         
         # Initialize OpenAI service
-        openai_service = OpenAIService()
+        openai_service = get_openai_service()
         
         # Create scraped data structure for OpenAI processing
         scraped_data = {
@@ -427,31 +406,9 @@ async def process_text(
             raise HTTPException(status_code=500, detail=f"Failed to save chunks to database: {str(e)}")
         
         # Upload chunks to VAPI as files and update vapi_file_id
-        from app.services.vapi_assistant import upload_chunk_to_vapi, sync_assistant_prompt
-        for saved_chunk in saved_chunks:
-            try:
-                chunk_id = saved_chunk.get('id')
-                chunk_name = saved_chunk.get('name', 'Unnamed Chunk')
-                chunk_content = saved_chunk.get('content', '')
-                bullets = saved_chunk.get('bullets', [])
-                sample_questions = saved_chunk.get('sample_questions', [])
-                
-                # Upload to VAPI with complete information
-                vapi_file_id = await upload_chunk_to_vapi(
-                    chunk_id, 
-                    chunk_name, 
-                    chunk_content,
-                    bullets=bullets,
-                    sample_questions=sample_questions
-                )
-                
-                # Update chunk with vapi_file_id
-                if vapi_file_id:
-                    supabase.table("chunks").update({"vapi_file_id": vapi_file_id}).eq("id", chunk_id).execute()
-                    logger.info(f"Updated chunk {chunk_id} with VAPI file ID: {vapi_file_id}")
-            except Exception as upload_error:
-                logger.warning(f"Failed to upload chunk {chunk_id} to VAPI: {str(upload_error)}")
-                # Continue with other chunks
+        if saved_chunks:
+            uploaded = await upload_chunks_to_vapi(saved_chunks)
+            logger.info(f"Uploaded {uploaded}/{len(saved_chunks)} chunks to VAPI")
         
         # Sync assistant with updated knowledge base file IDs
         receptionist_id = request.receptionist_id if hasattr(request, "receptionist_id") else None
@@ -548,31 +505,9 @@ async def process_text_simple(
             raise HTTPException(status_code=500, detail=f"Failed to save chunk to database: {str(e)}")
         
         # Upload chunk to VAPI as file and update vapi_file_id
-        from app.services.vapi_assistant import upload_chunk_to_vapi, sync_assistant_prompt
-        for saved_chunk in saved_chunks:
-            try:
-                chunk_id = saved_chunk.get('id')
-                chunk_name = saved_chunk.get('name', 'Unnamed Chunk')
-                chunk_content = saved_chunk.get('content', '')
-                bullets = saved_chunk.get('bullets', [])
-                sample_questions = saved_chunk.get('sample_questions', [])
-                
-                # Upload to VAPI with complete information
-                vapi_file_id = await upload_chunk_to_vapi(
-                    chunk_id, 
-                    chunk_name, 
-                    chunk_content,
-                    bullets=bullets,
-                    sample_questions=sample_questions
-                )
-                
-                # Update chunk with vapi_file_id
-                if vapi_file_id:
-                    supabase.table("chunks").update({"vapi_file_id": vapi_file_id}).eq("id", chunk_id).execute()
-                    logger.info(f"Updated chunk {chunk_id} with VAPI file ID: {vapi_file_id}")
-            except Exception as upload_error:
-                logger.warning(f"Failed to upload chunk {chunk_id} to VAPI: {str(upload_error)}")
-                # Continue with other chunks
+        if saved_chunks:
+            uploaded = await upload_chunks_to_vapi(saved_chunks)
+            logger.info(f"Uploaded {uploaded}/{len(saved_chunks)} chunks to VAPI")
         
         # Sync assistant with updated knowledge base file IDs
         receptionist_id = request.receptionist_id if hasattr(request, "receptionist_id") else None
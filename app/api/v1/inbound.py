@@ -5,13 +5,16 @@ Handles all inbound call operations including retrieval and management
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from app.utils.auth import get_current_user
-from app.database_operations import get_inbound_calls_by_user_organization
+from app.database_operations import get_inbound_call_by_id_and_org
+from app.vapi_processor import process_and_update_vapi_calls
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 import logging
-import requests
+import httpx
 from app.config.settings import DEBUG,VAPI_AUTH_TOKEN
 
-from app.database import get_supabase_client
+from app.database import get_supabase_client, run_supabase_async
+from app.api.v1.receptionist import _VAPI_HTTP
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Inbound Calls Management"])
@@ -85,8 +88,11 @@ async def get_inbound_calls(
         query = supabase.table("ai_receptionist_inbound_calls").select("*")
 
         # If receptionist_id provided, translate to assistant_id
+        assistant_id = None
         if receptionist_id:
-            rec_resp = supabase.table("receptionists").select("assistant_id").eq("id", receptionist_id).execute()
+            rec_resp = await run_supabase_async(
+                lambda: supabase.table("receptionists").select("assistant_id").eq("id", receptionist_id).execute()
+            )
             assistant_id = rec_resp.data[0]["assistant_id"] if rec_resp.data else None
             if assistant_id:
                 query = query.eq("assistant_id", assistant_id)
@@ -99,12 +105,13 @@ async def get_inbound_calls(
             try:
                 vapi_token = VAPI_AUTH_TOKEN
                 if vapi_token:
-                    vapi_resp = requests.get(
-                        f"https://api.vapi.ai/call?assistantId={assistant_id}",
-                        headers={"Authorization": f"Bearer {vapi_token}"}, timeout=15
+                    vapi_resp = await _VAPI_HTTP.get(
+                        "/call",
+                        params={"assistantId": assistant_id},
+                        headers={"Authorization": f"Bearer {vapi_token}"},
+                        timeout=15,
                     )
                     if vapi_resp.status_code == 200:
-                        from app.vapi_processor import process_and_update_vapi_calls
                         await process_and_update_vapi_calls(vapi_resp.json(), organization_id)
                 else:
                     logger.warning("VAPI_AUTH_TOKEN not configured – skipping live sync")
@@ -115,7 +122,7 @@ async def get_inbound_calls(
         offset = (page - 1) * page_size
         query = query.range(offset, offset + page_size - 1)
 
-        result = query.order("created_at", desc=True).execute()
+        result = await run_supabase_async(lambda: query.order("created_at", desc=True).execute())
 
         inbound_calls = result.data or []
         
@@ -133,7 +140,6 @@ async def get_inbound_calls(
             if created_at:
                 try:
                     # Parse the ISO timestamp and format as YYYY-MM-DD
-                    from datetime import datetime
                     if isinstance(created_at, str):
                         dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
                     else:
@@ -242,8 +248,6 @@ async def get_inbound_call_by_id(request: Dict[str, Any], current_user: dict = D
         logger.info(f"Fetching inbound call {call_id} for organization: {user_organization.get('name', 'Unknown')}")
         
         # Get the specific inbound call and verify organization ownership
-        from app.database_operations import get_inbound_call_by_id_and_org
-        
         inbound_call = await get_inbound_call_by_id_and_org(call_id, organization_id)
         
         if not inbound_call:
@@ -307,14 +311,14 @@ async def sync_vapi_calls(current_user: dict = Depends(get_current_user)):
                 detail="VAPI authentication token not configured"
             )
         
-        vapi_url = "https://api.vapi.ai/call"
+        vapi_url = "/call"
         headers = {
             "Authorization": f"Bearer {vapi_token}"
         }
         
-        logger.info(f"Calling VAPI API: {vapi_url}")
+        logger.info(f"Calling VAPI API: {_VAPI_HTTP.base_url}{vapi_url}")
         
-        response = requests.get(vapi_url, headers=headers)
+        response = await _VAPI_HTTP.get(vapi_url, headers=headers, timeout=30)
         
         if response.status_code != 200:
             error_message = f"VAPI API returned status {response.status_code}"
@@ -333,43 +337,22 @@ async def sync_vapi_calls(current_user: dict = Depends(get_current_user)):
         vapi_response_data = response.json()
         logger.info(f"VAPI API Response: {len(vapi_response_data)} calls received")
         
-        # Print to console
-        print("=" * 50)
-        print("VAPI API CALLS LIST:")
-        print("=" * 50)
-        print(f"Status Code: {response.status_code}")
-        print(f"Total Calls: {len(vapi_response_data)}")
-        print("=" * 50)
-        
         # Process and update database
         try:
-            from app.vapi_processor import process_and_update_vapi_calls
-            
             logger.info(f"Processing VAPI calls for organization: {organization_id}")
             processing_result = await process_and_update_vapi_calls(vapi_response_data, organization_id)
             
             if processing_result["success"]:
                 logger.info("Successfully processed and updated VAPI calls in database")
-                
-                # Print processing results to console
-                print("=" * 50)
-                print("DATABASE UPDATE RESULTS:")
-                print("=" * 50)
-                print(f"Total calls processed: {processing_result['total_calls_processed']}")
-                print(f"Inbound calls: {processing_result['inbound_calls']['count']} found, "
-                      f"{processing_result['inbound_calls']['updated']} updated, "
-                      f"{processing_result['inbound_calls']['inserted']} inserted")
-                print(f"Outbound calls: {processing_result['outbound_calls']['count']} found, "
-                      f"{processing_result['outbound_calls']['updated']} updated, "
-                      f"{processing_result['outbound_calls']['inserted']} inserted")
-                print(f"Total updated: {processing_result['summary']['total_updated']}")
-                print(f"Total inserted: {processing_result['summary']['total_inserted']}")
-                print(f"Errors: {processing_result['summary']['total_errors']}")
-                if processing_result['errors']:
-                    print("Error details:")
-                    for error in processing_result['errors']:
-                        print(f"  - {error}")
-                print("=" * 50)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "VAPI sync results: processed=%s inbound=%s outbound=%s summary=%s errors=%s",
+                        processing_result['total_calls_processed'],
+                        processing_result['inbound_calls'],
+                        processing_result['outbound_calls'],
+                        processing_result['summary'],
+                        processing_result['errors'],
+                    )
                 
                 return {
                     "message": "VAPI API sync successful and database updated",
@@ -394,7 +377,7 @@ async def sync_vapi_calls(current_user: dict = Depends(get_current_user)):
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"VAPI API request failed: {str(e)}")
         raise HTTPException(
             status_code=500,
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Depends, Header, Query
-from app.schemas.lead import Lead, LeadResponse, LeadList, LeadDB, GoogleSheetsResponse, LeadIdRequest, CallLeadResponse, CallLeadsRequest, CallLeadsResponse, VapiVoiceIdResponse, VapiBackendVoiceResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Depends, Header, Query, Response
+from app.schemas.lead import Lead, LeadResponse, LeadList, LeadDB, GoogleSheetsResponse, LeadIdRequest, CallLeadResponse, CallLeadsRequest, CallLeadsResponse, VapiVoiceIdResponse, VapiBackendVoiceResponse, normalize_phone_number
 from app.utils.auth import get_current_user
+from app.utils.request_body import json_body, json_body_openapi
 import logging
 import pandas as pd
 import io
@@ -9,15 +10,27 @@ import re
 import os
 from datetime import datetime
 from app.database import get_supabase_client
+from app.database_operations import save_inbound_call_data, update_outbound_call_data, get_organization_by_vapi_org_id
 from app.config.settings import VAPI_WEBHOOK_SECRET
 from typing import List, Tuple, Dict, Any, Optional
 from pydantic import BaseModel
 import httpx
+import orjson
 import os
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Outbound Management"])
 
+# Columns exposed by LeadDB; get_leads projects rows onto these and encodes them directly
+_LEAD_DB_FIELDS = tuple(LeadDB.model_fields)
+
+
+def _project_lead(lead: dict) -> dict:
+    """Project a leads row onto the LeadDB fields, normalizing the phone like LeadDB would"""
+    projected = {field: lead.get(field) for field in _LEAD_DB_FIELDS}
+    projected["phone_number"] = normalize_phone_number(projected["phone_number"])
+    return projected
+
 
 async def insert_leads_to_database(valid_rows: List[dict], source: str, source_info: str = None, current_user: dict = None) -> List[dict]:
     """
@@ -42,11 +55,8 @@ async def insert_leads_to_database(valid_rows: List[dict], source: str, source_i
         # Prepare data for insertion (map to database column names)
         db_rows = []
         for row in valid_rows:
-            # Format phone number with + prefix if not present
-            phone_number = row["PhoneNumber"]
-            formatted_phone = phone_number
-            if phone_number and not formatted_phone.startswith('+'):
-                formatted_phone = f"+{formatted_phone}"
+            # Strip formatting and add the + prefix if not present
+            formatted_phone = normalize_phone_number(row["PhoneNumber"])
             
             db_row = {
                 "first_name": row["FirstName"],
@@ -88,10 +98,7 @@ async def insert_leads_to_database(valid_rows: List[dict], source: str, source_i
         mapped_records = []
         for record in result.data:
             # Ensure phone number is formatted with + prefix
-            phone_number = record.get("phone_number", "")
-            formatted_phone = phone_number
-            if phone_number and not formatted_phone.startswith('+'):
-                formatted_phone = f"+{formatted_phone}"
+            formatted_phone = normalize_phone_number(record.get("phone_number", ""))
             
             mapped_record = {
                 "FirstName": record.get("first_name", ""),
@@ -207,7 +214,7 @@ def validate_sheet_data(df: pd.DataFrame) -> Tuple[List[dict], List[str]]:
     return valid_rows, invalid_rows
 
 
-@router.post("/upload_url", response_model=GoogleSheetsResponse)
+@router.post("/upload_url", response_model=GoogleSheetsResponse, response_model_exclude_unset=True)
 async def upload_url(
     sheets_url: str = Form(...),
     current_user: dict = Depends(get_current_user)
@@ -322,7 +329,7 @@ async def upload_url(
         logger.error(f"Google Sheets processing error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=error_msg)
 
-@router.post("/upload_excel", response_model=GoogleSheetsResponse)
+@router.post("/upload_excel", response_model=GoogleSheetsResponse, response_model_exclude_unset=True)
 async def upload_excel(
     file: UploadFile = File(...),
     current_user: dict = Depends(get_current_user)
@@ -346,12 +353,10 @@ async def upload_excel(
         raise HTTPException(status_code=400, detail="File must be a CSV file (.csv)")
     
     try:
-        # Read CSV file
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Parse with pandas
-        df = pd.read_csv(io.StringIO(csv_content))
+        # Parse with pandas straight from the spooled upload file, rather than
+        # buffering the bytes, a decoded copy and a StringIO copy in memory
+        await file.seek(0)
+        df = pd.read_csv(file.file, encoding='utf-8')
         
         # Use common validation function
         valid_rows, invalid_rows = validate_sheet_data(df)
@@ -482,7 +487,7 @@ async def get_leads(
         
         # Check and update leads with missing VAPI call data
         updated_leads = []
-        print(f"Result: {result.data}")
+        logger.debug("Leads query returned %d rows", len(result.data or []))
         for lead in result.data:
             vapi_call_id = lead.get("vapi_call_id")
             if (vapi_call_id and 
@@ -517,13 +522,17 @@ async def get_leads(
         # Log user action
         logger.info(f"User {current_user.get('email', 'unknown')} retrieved {len(updated_leads)} of their own leads from database")
         
-        print(f"✅ Retrieved {len(updated_leads)} leads for user {current_user.get('email', 'unknown')} from database")
+        logger.debug("Retrieved %d leads for user %s", len(updated_leads), current_user.get('email', 'unknown'))
         
-        return updated_leads
+        # Rows come straight from the leads table, so skip per-row LeadDB validation
+        # and encode the projected rows in one pass (response_model stays for the docs)
+        return Response(
+            content=orjson.dumps([_project_lead(lead) for lead in updated_leads]),
+            media_type="application/json",
+        )
         
     except Exception as e:
         logger.error(f"Failed to retrieve leads: {e}")
-        print(f"❌ Failed to retrieve leads: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve leads: {str(e)}")
 
 
@@ -592,7 +601,7 @@ async def get_summary_by_lead_id(request: LeadIdRequest, current_user: dict = De
             )
         
         lead_id = request.lead_id
-        print(f"User {current_user.get('email', 'unknown')} requesting lead ID: {lead_id}")
+        logger.debug("User %s requesting lead ID: %s", current_user.get('email', 'unknown'), lead_id)
         
         # Get the lead by ID and verify it belongs to user's organization
         result = supabase.table(table_name).select("*").eq("id", lead_id).eq("organization_id", organization_id).execute()
@@ -645,7 +654,6 @@ async def get_summary_by_lead_id(request: LeadIdRequest, current_user: dict = De
         
         # Log user action
         logger.info(f"User {current_user.get('email', 'unknown')} retrieved lead ID: {lead_id}")
-        print(f"✅ Retrieved lead ID {lead_id} for user {current_user.get('email', 'unknown')}")
         
         return lead
         
@@ -654,12 +662,11 @@ async def get_summary_by_lead_id(request: LeadIdRequest, current_user: dict = De
         raise
     except Exception as e:
         logger.error(f"Failed to retrieve lead {lead_id}: {e}")
-        print(f"❌ Failed to retrieve lead {lead_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve lead: {str(e)}")
 
 
-@router.post("/call_leads", response_model=CallLeadsResponse)
-async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get_current_user)):
+@router.post("/call_leads", response_model=CallLeadsResponse, openapi_extra=json_body_openapi(CallLeadsRequest))
+async def call_leads(request: CallLeadsRequest = Depends(json_body(CallLeadsRequest)), current_user: dict = Depends(get_current_user)):
     """
     Initiate calls to multiple leads using VAPI
     
@@ -748,7 +755,7 @@ async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get
                 detail="No lead IDs provided"
             )
         
-        print(f"User {current_user.get('email', 'unknown')} initiating calls for {len(lead_ids)} leads")
+        logger.debug("User %s initiating calls for %d leads", current_user.get('email', 'unknown'), len(lead_ids))
         
         # Get all leads by IDs and verify they belong to user's organization
         result = supabase.table(table_name).select("*").in_("id", lead_ids).eq("organization_id", organization_id).execute()
@@ -795,9 +802,7 @@ async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get
                 continue
             
             # Format phone number with + prefix if not present
-            formatted_phone = phone_number
-            if not formatted_phone.startswith('+'):
-                formatted_phone = f"+{formatted_phone}"
+            formatted_phone = normalize_phone_number(phone_number)
             
             # Add to VAPI customers list
             customers_for_vapi.append({
@@ -841,8 +846,7 @@ async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get
                 # Add successful results
                 for lead in valid_leads:
                     lead_id = lead["id"]
-                    phone_number = lead.get("phone_number")
-                    formatted_phone = f"+{phone_number}" if not phone_number.startswith('+') else phone_number
+                    formatted_phone = normalize_phone_number(lead.get("phone_number"))
                     customer_name = f"{lead.get('first_name', '')} {lead.get('last_name', '')}".strip()
                     
                     if formatted_phone in phone_to_result:
@@ -874,8 +878,7 @@ async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get
                 for lead in valid_leads:
                     lead_id = lead["id"]
                     customer_name = f"{lead.get('first_name', '')} {lead.get('last_name', '')}".strip()
-                    phone_number = lead.get("phone_number", "")
-                    formatted_phone = f"+{phone_number}" if phone_number and not phone_number.startswith('+') else phone_number
+                    formatted_phone = normalize_phone_number(lead.get("phone_number", ""))
                     
                     results.append({
                         "lead_id": lead_id,
@@ -889,7 +892,6 @@ async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get
         # Log overall results
         voice_info = f" with voice '{request.voiceId}'" if hasattr(request, 'voiceId') and request.voiceId else ""
         logger.info(f"User {current_user.get('email', 'unknown')} completed call initiation for {len(lead_ids)} leads{voice_info}: {successful_calls} successful, {failed_calls} failed")
-        print(f"✅ Completed call initiation{voice_info}: {successful_calls} successful, {failed_calls} failed out of {len(lead_ids)} leads")
         
         return {
             "message": f"Call initiation completed{voice_info}. {successful_calls} successful, {failed_calls} failed out of {len(lead_ids)} leads",
@@ -905,7 +907,6 @@ async def call_leads(request: CallLeadsRequest, current_user: dict = Depends(get
         raise
     except Exception as e:
         logger.error(f"Failed to process call requests: {str(e)}")
-        print(f"❌ Failed to process call requests: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to process call requests: {str(e)}")
 
 
@@ -942,7 +943,7 @@ async def make_vapi_call_batch(customers: List[dict]) -> dict:
         }
         
         logger.info(f"Making batch VAPI call for {len(customers)} customers")
-        print(vapi_payload)
+        logger.debug("VAPI batch call payload: %s", vapi_payload)
         # Make request to VAPI
         response = requests.post(
             "https://api.vapi.ai/call",
@@ -1376,20 +1377,13 @@ async def vapi_webhook(
             customer_number = call_data.get("customer", {}).get("number", "Unknown")
             phone_number = request.get("phoneNumber", {}).get("number", "Unknown")
             
-            # Print to console
-            print("🎯 VAPI END-OF-CALL REPORT RECEIVED")
-            print("=" * 60)
-            print(f"📞 Call ID: {call_id}")
-            print(f"📱 Customer Number: {customer_number}")
-            print(f"📞 Phone Number: {phone_number}")
-            print(f"🎵 Recording URL: {recording_url}")
-            print(f"📝 Summary: {summary}")
-            print(f"📊 Success Evaluation: {success_eval}")
-            print(f"⏱️  Duration: {duration_seconds} seconds")
-            print(f"💸 Cost: ${cost}")
-            print(f"🔚 Ended Reason: {ended_reason}")
-            print(f"📄 Transcript: {transcript[:200]}..." if len(transcript) > 200 else f"📄 Transcript: {transcript}")
-            print("=" * 60)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "End-of-call report: call_id=%s customer=%s phone=%s recording=%s "
+                    "success=%s duration=%ss cost=$%s ended_reason=%s summary=%s transcript=%.200s",
+                    call_id, customer_number, phone_number, recording_url,
+                    success_eval, duration_seconds, cost, ended_reason, summary, transcript,
+                )
             
             # Log to logger as well
             logger.info(f"End-of-call report received for call {call_id}")
@@ -1418,9 +1412,6 @@ async def vapi_webhook(
                 "phone_number_id": phone_number
             }
             
-            # Import database operations
-            from app.database_operations import save_inbound_call_data, update_outbound_call_data, get_organization_by_vapi_org_id
-            
             try:
                 # Get organization ID from VAPI org ID in the webhook payload
                 vapi_org_id = call_data.get("orgId")
@@ -1445,7 +1436,6 @@ async def vapi_webhook(
                     saved_call = await save_inbound_call_data(call_data_for_db, organization_id)
                     if saved_call:
                         logger.info(f"Successfully saved inbound call data for call ID: {call_id}")
-                        print(f"💾 Saved inbound call data to database")
                     else:
                         logger.warning(f"Failed to save inbound call data for call ID: {call_id}")
                         
@@ -1454,17 +1444,14 @@ async def vapi_webhook(
                     updated_lead = await update_outbound_call_data(call_data_for_db, organization_id)
                     if updated_lead:
                         logger.info(f"Successfully updated outbound call data for call ID: {call_id}")
-                        print(f"💾 Updated outbound call data in leads table")
                     else:
                         logger.warning(f"Failed to update outbound call data for call ID: {call_id}")
                         
                 else:
                     logger.warning(f"Unknown call type: {call_type}")
-                    print(f"⚠️  Unknown call type: {call_type}")
                     
             except Exception as e:
                 logger.error(f"Error saving call data to database: {str(e)}")
-                print(f"❌ Error saving call data: {str(e)}")
                 # Don't raise exception - webhook should still succeed
             
         else:
@@ -1517,10 +1504,10 @@ async def call_number(
     phone_e164 = payload.phone if payload.phone.startswith("+") else f"+1{payload.phone}"
     full_name = (payload.first_name or "") + (f" {payload.last_name}" if payload.last_name else "")
 
-    print("phone_number_id", phone_number_id)
-    print("assistant_id", assistant_id)
-    print("phone_e164", phone_e164)
-    print("full_name", full_name)
+    logger.debug(
+        "Single call: phone_number_id=%s assistant_id=%s phone=%s name=%s",
+        phone_number_id, assistant_id, phone_e164, full_name,
+    )
 
     vapi_payload = {
         "assistantId": assistant_id,
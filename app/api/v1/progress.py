@@ -1,14 +1,29 @@
 from typing import Optional
-import json
 import logging
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 import redis.asyncio as aioredis
-from app.config.settings import REDIS_URL
+from app.config.settings import REDIS_URL, BACKEND_CORS_ORIGINS
+from app.utils.redis_client import redis_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Scrape Progress"])
 
+_ALLOWED_WS_ORIGINS = frozenset(BACKEND_CORS_ORIGINS)
+
+# Pub/sub listeners hold a connection for the lifetime of a socket, so they get
+# their own pool (kept apart from redis_client). Connections are returned to it
+# when a listener closes and reused by the next subscriber instead of dialling
+# Redis again per connection.
+_pubsub_redis = aioredis.from_url(REDIS_URL, socket_keepalive=True)
+
+
+async def close_pubsub_redis() -> None:
+    """Close the pub/sub connection pool (called on app shutdown)."""
+    await _pubsub_redis.close()
+    await _pubsub_redis.connection_pool.disconnect()
+
 @router.get("/")
 async def progress_root():
     """Test endpoint for progress router"""
@@ -18,18 +33,8 @@ async def progress_root():
 async def scrape_progress_ws(websocket: WebSocket, task_id: str):
     # Check origin for CORS
     origin = websocket.headers.get("origin")
-    allowed_origins = [
-        "http://localhost:8080",
-        "http://localhost:8081", 
-        "http://127.0.0.1:8080",
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-        "https://myaireceptionist.indrasol.com"
-    ]
     
-    if origin not in allowed_origins and origin is not None:
+    if origin not in _ALLOWED_WS_ORIGINS and origin is not None:
         logger.warning(f"WebSocket connection rejected from origin: {origin}")
         await websocket.close(code=1008, reason="Origin not allowed")
         return
@@ -39,14 +44,13 @@ async def scrape_progress_ws(websocket: WebSocket, task_id: str):
     
     logger.info(f"WebSocket connected for task {task_id} from origin: {origin}")
     
+    pubsub = _pubsub_redis.pubsub()
+    channel = f"scrape:{task_id}"
     try:
-        r = aioredis.from_url(REDIS_URL)
-        pubsub = r.pubsub()
-        channel = f"scrape:{task_id}"
         await pubsub.subscribe(channel)
         
         # First send cached log list
-        past_logs = await r.lrange(f"{channel}:log", 0, -1)
+        past_logs = await redis_client.lrange(f"{channel}:log", 0, -1)
         logger.info(f"Sending {len(past_logs)} cached logs for task {task_id}")
         
         for log_line in past_logs:
@@ -71,3 +75,33 @@ async def scrape_progress_ws(websocket: WebSocket, task_id: str):
             await pubsub.close()
         except:
             pass
+
+
+@router.get("/scrape/{task_id}/events")
+async def scrape_progress_sse(request: Request, task_id: str):
+    """Server-Sent Events stream of scrape progress (for clients that can't use WebSockets)."""
+    channel = f"scrape:{task_id}"
+
+    async def event_stream():
+        pubsub = _pubsub_redis.pubsub()
+        try:
+            # Subscribe before reading the backlog so no message falls in between
+            await pubsub.subscribe(channel)
+            for log_line in await redis_client.lrange(f"{channel}:log", 0, -1):
+                yield f"data: {log_line.decode()}\n\n"
+
+            while not await request.is_disconnected():
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=15)
+                if msg is None:
+                    yield ": keep-alive\n\n"
+                elif msg["type"] == "message":
+                    yield f"data: {msg['data'].decode()}\n\n"
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
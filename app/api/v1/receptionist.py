@@ -1,21 +1,138 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from app.schemas.lead import VapiVoicesResponse, VapiPhoneNumbersResponse
 from app.schemas.phone_number import PhoneNumberResponse
-from app.utils.auth import get_current_user
-from app.database import get_supabase_client
+from app.utils.auth import get_current_user, require_valid_token
+from app.database import get_supabase_client, run_supabase_async
 from app.services.vapi_phone_sync_service import VapiPhoneSyncService
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 import logging
 import os
 import httpx
 from app.services.vapi_assistant import build_assistant_payload
+from app.db.pool import get_pg_pool
 import asyncio
 import re
+import hashlib
+import orjson
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Creation flow (voices, phone numbers, create) and CRUD on existing
+# receptionists are mounted under separate prefixes in router.py
+create_router = APIRouter()
+manage_router = APIRouter()
+
+# Characters stripped from phone numbers before country-code matching
+_PHONE_CLEAN_RE = re.compile(r'[\s\-\(\)]')
+
+# Country code mappings (most common ones)
+COUNTRY_CODES = {
+    '+1': 'United States',
+    '+44': 'United Kingdom',
+    '+49': 'Germany',
+    '+33': 'France',
+    '+39': 'Italy',
+    '+34': 'Spain',
+    '+31': 'Netherlands',
+    '+41': 'Switzerland',
+    '+43': 'Austria',
+    '+32': 'Belgium',
+    '+45': 'Denmark',
+    '+46': 'Sweden',
+    '+47': 'Norway',
+    '+358': 'Finland',
+    '+354': 'Iceland',
+    '+353': 'Ireland',
+    '+351': 'Portugal',
+    '+30': 'Greece',
+    '+48': 'Poland',
+    '+420': 'Czech Republic',
+    '+421': 'Slovakia',
+    '+36': 'Hungary',
+    '+385': 'Croatia',
+    '+386': 'Slovenia',
+    '+372': 'Estonia',
+    '+371': 'Latvia',
+    '+370': 'Lithuania',
+    '+81': 'Japan',
+    '+82': 'South Korea',
+    '+86': 'China',
+    '+852': 'Hong Kong',
+    '+853': 'Macau',
+    '+886': 'Taiwan',
+    '+65': 'Singapore',
+    '+60': 'Malaysia',
+    '+66': 'Thailand',
+    '+84': 'Vietnam',
+    '+63': 'Philippines',
+    '+62': 'Indonesia',
+    '+91': 'India',
+    '+92': 'Pakistan',
+    '+880': 'Bangladesh',
+    '+94': 'Sri Lanka',
+    '+977': 'Nepal',
+    '+975': 'Bhutan',
+    '+960': 'Maldives',
+    '+7': 'Russia',
+    '+7': 'Kazakhstan',  # Same code as Russia
+    '+380': 'Ukraine',
+    '+375': 'Belarus',
+    '+374': 'Armenia',
+    '+995': 'Georgia',
+    '+994': 'Azerbaijan',
+    '+998': 'Uzbekistan',
+    '+996': 'Kyrgyzstan',
+    '+992': 'Tajikistan',
+    '+993': 'Turkmenistan',
+    '+61': 'Australia',
+    '+64': 'New Zealand',
+    '+27': 'South Africa',
+    '+20': 'Egypt',
+    '+234': 'Nigeria',
+    '+254': 'Kenya',
+    '+233': 'Ghana',
+    '+212': 'Morocco',
+    '+213': 'Algeria',
+    '+216': 'Tunisia',
+    '+218': 'Libya',
+    '+20': 'Egypt',
+    '+966': 'Saudi Arabia',
+    '+971': 'UAE',
+    '+974': 'Qatar',
+    '+965': 'Kuwait',
+    '+973': 'Bahrain',
+    '+968': 'Oman',
+    '+964': 'Iraq',
+    '+98': 'Iran',
+    '+90': 'Turkey',
+    '+972': 'Israel',
+    '+962': 'Jordan',
+    '+961': 'Lebanon',
+    '+963': 'Syria',
+    '+20': 'Egypt',
+    '+52': 'Mexico',
+    '+55': 'Brazil',
+    '+54': 'Argentina',
+    '+56': 'Chile',
+    '+57': 'Colombia',
+    '+58': 'Venezuela',
+    '+51': 'Peru',
+    '+593': 'Ecuador',
+    '+591': 'Bolivia',
+    '+595': 'Paraguay',
+    '+598': 'Uruguay',
+    '+506': 'Costa Rica',
+    '+507': 'Panama',
+    '+502': 'Guatemala',
+    '+504': 'Honduras',
+    '+503': 'El Salvador',
+    '+505': 'Nicaragua',
+    '+53': 'Cuba',
+}
+
+# Sorted once at import; longest codes are matched first
+_COUNTRY_CODES_LONGEST_FIRST = tuple(sorted(COUNTRY_CODES, key=len, reverse=True))
 
 def get_country_from_phone_number(phone_number: str) -> str:
     """
@@ -27,118 +144,20 @@ def get_country_from_phone_number(phone_number: str) -> str:
     Returns:
         Country name or "Unknown" if not found
     """
-    # Remove any spaces, dashes, or parentheses
-    cleaned_number = re.sub(r'[\s\-\(\)]', '', phone_number)
-    
-    # Country code mappings (most common ones)
-    country_codes = {
-        '+1': 'United States',
-        '+44': 'United Kingdom',
-        '+49': 'Germany',
-        '+33': 'France',
-        '+39': 'Italy',
-        '+34': 'Spain',
-        '+31': 'Netherlands',
-        '+41': 'Switzerland',
-        '+43': 'Austria',
-        '+32': 'Belgium',
-        '+45': 'Denmark',
-        '+46': 'Sweden',
-        '+47': 'Norway',
-        '+358': 'Finland',
-        '+354': 'Iceland',
-        '+353': 'Ireland',
-        '+351': 'Portugal',
-        '+30': 'Greece',
-        '+48': 'Poland',
-        '+420': 'Czech Republic',
-        '+421': 'Slovakia',
-        '+36': 'Hungary',
-        '+385': 'Croatia',
-        '+386': 'Slovenia',
-        '+372': 'Estonia',
-        '+371': 'Latvia',
-        '+370': 'Lithuania',
-        '+81': 'Japan',
-        '+82': 'South Korea',
-        '+86': 'China',
-        '+852': 'Hong Kong',
-        '+853': 'Macau',
-        '+886': 'Taiwan',
-        '+65': 'Singapore',
-        '+60': 'Malaysia',
-        '+66': 'Thailand',
-        '+84': 'Vietnam',
-        '+63': 'Philippines',
-        '+62': 'Indonesia',
-        '+91': 'India',
-        '+92': 'Pakistan',
-        '+880': 'Bangladesh',
-        '+94': 'Sri Lanka',
-        '+977': 'Nepal',
-        '+975': 'Bhutan',
-        '+960': 'Maldives',
-        '+7': 'Russia',
-        '+7': 'Kazakhstan',  # Same code as Russia
-        '+380': 'Ukraine',
-        '+375': 'Belarus',
-        '+374': 'Armenia',
-        '+995': 'Georgia',
-        '+994': 'Azerbaijan',
-        '+998': 'Uzbekistan',
-        '+996': 'Kyrgyzstan',
-        '+992': 'Tajikistan',
-        '+993': 'Turkmenistan',
-        '+61': 'Australia',
-        '+64': 'New Zealand',
-        '+27': 'South Africa',
-        '+20': 'Egypt',
-        '+234': 'Nigeria',
-        '+254': 'Kenya',
-        '+233': 'Ghana',
-        '+212': 'Morocco',
-        '+213': 'Algeria',
-        '+216': 'Tunisia',
-        '+218': 'Libya',
-        '+20': 'Egypt',
-        '+966': 'Saudi Arabia',
-        '+971': 'UAE',
-        '+974': 'Qatar',
-        '+965': 'Kuwait',
-        '+973': 'Bahrain',
-        '+968': 'Oman',
-        '+964': 'Iraq',
-        '+98': 'Iran',
-        '+90': 'Turkey',
-        '+972': 'Israel',
-        '+962': 'Jordan',
-        '+961': 'Lebanon',
-        '+963': 'Syria',
-        '+20': 'Egypt',
-        '+52': 'Mexico',
-        '+55': 'Brazil',
-        '+54': 'Argentina',
-        '+56': 'Chile',
-        '+57': 'Colombia',
-        '+58': 'Venezuela',
-        '+51': 'Peru',
-        '+593': 'Ecuador',
-        '+591': 'Bolivia',
-        '+595': 'Paraguay',
-        '+598': 'Uruguay',
-        '+506': 'Costa Rica',
-        '+507': 'Panama',
-        '+502': 'Guatemala',
-        '+504': 'Honduras',
-        '+503': 'El Salvador',
-        '+505': 'Nicaragua',
-        '+53': 'Cuba',
-    }
+    # Only international numbers can be matched against a country code
+    if len(phone_number or "") < 2 or phone_number[0] != '+':
+        return "Unknown"
+
+    # Remove any spaces, dashes, or parentheses (stored numbers are usually already clean E.164)
+    if any(c in phone_number for c in ' -()'):
+        cleaned_number = _PHONE_CLEAN_RE.sub('', phone_number)
+    else:
+        cleaned_number = phone_number
     
     # Check for country codes (longest first to avoid partial matches)
-    for code in sorted(country_codes.keys(), key=len, reverse=True):
+    for code in _COUNTRY_CODES_LONGEST_FIRST:
         if cleaned_number.startswith(code):
-            return country_codes[code]
+            return COUNTRY_CODES[code]
     
     return "Unknown"
 
@@ -151,11 +170,106 @@ class VapiPhoneSyncResponse(BaseModel):
     inserted: int
     updated: int
     skipped: int
-    errors: List[str] = []
+    errors: List[str] = Field(default_factory=list)
 
 
-@router.get("/get_assistants", response_model=VapiVoicesResponse)
-async def get_assistants(current_user: dict = Depends(get_current_user)):
+# Predefined list of voice agents with their properties.
+# These are immutable constants; the response below is built once at import.
+VOICE_AGENTS = [
+    {
+        "display_name": "Alex",
+        "age": "22",
+        "gender": "male",
+        "ethnicity": "white",
+        "tone": "deeper tone",
+        "personality": ["calming", "professional"],
+        "description": "22 year old white male with deeper tone, calming and professional"
+    },
+    {
+        "display_name": "Maya",
+        "age": "24",
+        "gender": "male",
+        "ethnicity": "white",
+        "tone": "clear",
+        "personality": ["energetic", "professional"],
+        "description": "24 year old white male, clear, energetic and professional"
+    },
+    {
+        "display_name": "Jordan",
+        "age": "26",
+        "gender": "female",
+        "tone": "energetic",
+        "personality": ["quippy", "lighthearted", "cheeky", "amused"],
+        "description": "26 year old female, energetic, quippy, lighthearted, cheeky and amused"
+    },
+    {
+        "display_name": "Priya",
+        "age": "30",
+        "gender": "female",
+        "ethnicity": "indian",
+        "personality": ["professional", "charming"],
+        "description": "30 year old Indian female, professional and charming"
+    },
+    {
+        "display_name": "Emma",
+        "age": "23",
+        "gender": "female",
+        "ethnicity": "american",
+        "description": "23 year old American female"
+    },
+    {
+        "display_name": "Grace",
+        "age": "25",
+        "gender": "female",
+        "ethnicity": "american",
+        "accent": "southern accent",
+        "description": "25 years old American female with southern accent"
+    },
+    {
+        "display_name": "Sophie",
+        "age": "26",
+        "gender": "female",
+        "ethnicity": "british",
+        "accent": "british accent",
+        "description": "26 year old British female with british accent"
+    },
+    {
+        "display_name": "Lily",
+        "age": "24",
+        "gender": "female",
+        "ethnicity": "australian",
+        "accent": "australian accent",
+        "description": "24 year old Australian female with australian accent"
+    },
+    {
+        "display_name": "Zoe",
+        "age": "28",
+        "gender": "female",
+        "ethnicity": "canadian",
+        "accent": "canadian accent",
+        "description": "28 year old Canadian female with canadian accent"
+    },
+    {
+        "display_name": "Aria",
+        "age": "27",
+        "gender": "female",
+        "ethnicity": "american",
+        "description": "27 year old American female"
+    }
+]
+
+# Pre-serialized once; the endpoint returns these bytes as-is
+_VOICES_BLOB = orjson.dumps(VapiVoicesResponse(
+    message=f"Successfully fetched {len(VOICE_AGENTS)} voice agents",
+    assistants=VOICE_AGENTS,
+    total_count=len(VOICE_AGENTS)
+).model_dump())
+_VOICES_ETAG = f'"{hashlib.sha256(_VOICES_BLOB).hexdigest()}"'
+_VOICES_CACHE_HEADERS = {"ETag": _VOICES_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
+@create_router.get("/get_assistants", response_model=VapiVoicesResponse)
+async def get_assistants(request: Request, claims: dict = Depends(require_valid_token)):
     """
     Get list of available voice agents with their properties
     
@@ -199,105 +313,13 @@ async def get_assistants(current_user: dict = Depends(get_current_user)):
     "total_count": 10
     }
     """
-    try:
-        # Predefined list of voice agents with their properties
-        voice_agents = [
-            {
-                "display_name": "Alex",
-                "age": "22",
-                "gender": "male",
-                "ethnicity": "white",
-                "tone": "deeper tone",
-                "personality": ["calming", "professional"],
-                "description": "22 year old white male with deeper tone, calming and professional"
-            },
-            {
-                "display_name": "Maya",
-                "age": "24",
-                "gender": "male",
-                "ethnicity": "white",
-                "tone": "clear",
-                "personality": ["energetic", "professional"],
-                "description": "24 year old white male, clear, energetic and professional"
-            },
-            {
-                "display_name": "Jordan",
-                "age": "26",
-                "gender": "female",
-                "tone": "energetic",
-                "personality": ["quippy", "lighthearted", "cheeky", "amused"],
-                "description": "26 year old female, energetic, quippy, lighthearted, cheeky and amused"
-            },
-            {
-                "display_name": "Priya",
-                "age": "30",
-                "gender": "female",
-                "ethnicity": "indian",
-                "personality": ["professional", "charming"],
-                "description": "30 year old Indian female, professional and charming"
-            },
-            {
-                "display_name": "Emma",
-                "age": "23",
-                "gender": "female",
-                "ethnicity": "american",
-                "description": "23 year old American female"
-            },
-            {
-                "display_name": "Grace",
-                "age": "25",
-                "gender": "female",
-                "ethnicity": "american",
-                "accent": "southern accent",
-                "description": "25 years old American female with southern accent"
-            },
-            {
-                "display_name": "Sophie",
-                "age": "26",
-                "gender": "female",
-                "ethnicity": "british",
-                "accent": "british accent",
-                "description": "26 year old British female with british accent"
-            },
-            {
-                "display_name": "Lily",
-                "age": "24",
-                "gender": "female",
-                "ethnicity": "australian",
-                "accent": "australian accent",
-                "description": "24 year old Australian female with australian accent"
-            },
-            {
-                "display_name": "Zoe",
-                "age": "28",
-                "gender": "female",
-                "ethnicity": "canadian",
-                "accent": "canadian accent",
-                "description": "28 year old Canadian female with canadian accent"
-            },
-            {
-                "display_name": "Aria",
-                "age": "27",
-                "gender": "female",
-                "ethnicity": "american",
-                "description": "27 year old American female"
-            }
-        ]
-        
-        logger.info(f"Successfully fetched {len(voice_agents)} voice agents")
-        
-        return VapiVoicesResponse(
-            message=f"Successfully fetched {len(voice_agents)} voice agents",
-            assistants=voice_agents,
-            total_count=len(voice_agents)
-        )
-        
-    except Exception as e:
-        logger.error(f"Unexpected error fetching voice agents: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch voice agents: {str(e)}")
+    if_none_match = request.headers.get("if-none-match", "")
+    if _VOICES_ETAG in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=_VOICES_CACHE_HEADERS)
+    return Response(content=_VOICES_BLOB, media_type="application/json", headers=_VOICES_CACHE_HEADERS)
 
 
-@router.get("/get_available_phoneNumber", response_model=VapiPhoneNumbersResponse)
+@create_router.get("/get_available_phoneNumber", response_model=VapiPhoneNumbersResponse)
 async def get_available_phone_number(current_user: dict = Depends(get_current_user)):
     """
     Get list of available phone numbers that are not assigned to any assistant or workflow.
@@ -349,32 +371,32 @@ async def get_available_phone_number(current_user: dict = Depends(get_current_us
             raise HTTPException(status_code=400, detail="User has no organization")
         
         # Step 1: Sync phone numbers from VAPI first to get latest status
-        logger.info(f"Syncing phone numbers from VAPI for organization {organization_id}")
+        logger.info("Syncing phone numbers from VAPI for organization %s", organization_id)
         
         try:
             sync_service = VapiPhoneSyncService()
             
             # Fetch latest phone numbers from VAPI
             vapi_phone_numbers = await sync_service.fetch_phone_numbers_from_vapi()
-            logger.info(f"Fetched {len(vapi_phone_numbers)} phone numbers from VAPI")
+            logger.info("Fetched %d phone numbers from VAPI", len(vapi_phone_numbers))
             
             # Sync to database (this updates existing records with latest status)
             user_id = current_user.get("user_id", "system")
             sync_result = await sync_service.sync_phone_numbers(vapi_phone_numbers, user_id, organization_id)
-            logger.info(f"Sync result: {sync_result['inserted']} inserted, {sync_result['updated']} updated, {sync_result['skipped']} skipped")
+            logger.info("Sync result: %s inserted, %s updated, %s skipped", sync_result['inserted'], sync_result['updated'], sync_result['skipped'])
             
         except Exception as sync_error:
-            logger.warning(f"Failed to sync from VAPI, using cached data: {str(sync_error)}")
+            logger.warning("Failed to sync from VAPI, using cached data: %s", sync_error)
             # Continue with cached data if sync fails
         
         # Step 2: Query database for available (unassigned) phone numbers
         supabase = get_supabase_client()
         
         # Query phone numbers from database - only return numbers not assigned to assistant or workflow
-        response = supabase.table("phone_numbers").select("*").eq("status", "active").is_("assistant_id", None).is_("workflow_id", None).order("created_at", desc=False).execute()
+        response = await run_supabase_async(lambda: supabase.table("phone_numbers").select("*").eq("status", "active").is_("assistant_id", None).is_("workflow_id", None).order("created_at", desc=False).execute())
         
         if not response.data:
-            logger.warning(f"No available (unassigned) phone numbers found for organization {organization_id}")
+            logger.warning("No available (unassigned) phone numbers found for organization %s", organization_id)
             return VapiPhoneNumbersResponse(
                 message="No available phone numbers found. All numbers are assigned to assistants or workflows.",
                 phone_numbers=[],
@@ -403,7 +425,7 @@ async def get_available_phone_number(current_user: dict = Depends(get_current_us
             }
             phone_numbers.append(phone_number)
         
-        logger.info(f"Successfully fetched {len(phone_numbers)} available phone numbers for organization {organization_id}")
+        logger.info("Successfully fetched %d available phone numbers for organization %s", len(phone_numbers), organization_id)
         
         return VapiPhoneNumbersResponse(
             message=f"Successfully fetched {len(phone_numbers)} available phone numbers (synced from VAPI)",
@@ -414,11 +436,11 @@ async def get_available_phone_number(current_user: dict = Depends(get_current_us
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error syncing and fetching phone numbers: {str(e)}")
+        logger.error("Unexpected error syncing and fetching phone numbers: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to sync and fetch phone numbers: {str(e)}")
 
 
-@router.post("/sync_vapi_phone_numbers", response_model=VapiPhoneSyncResponse)
+@create_router.post("/sync_vapi_phone_numbers", response_model=VapiPhoneSyncResponse)
 async def sync_vapi_phone_numbers(current_user: dict = Depends(get_current_user)):
     """
     Sync phone numbers from VAPI API to our database
@@ -462,7 +484,7 @@ async def sync_vapi_phone_numbers(current_user: dict = Depends(get_current_user)
         if not user_id:
             raise HTTPException(status_code=400, detail="User ID not found")
         
-        logger.info(f"Starting VAPI phone number sync from API for organization {organization_id} by user {user_id}")
+        logger.info("Starting VAPI phone number sync from API for organization %s by user %s", organization_id, user_id)
         
         # Initialize sync service
         sync_service = VapiPhoneSyncService()
@@ -487,10 +509,52 @@ async def sync_vapi_phone_numbers(current_user: dict = Depends(get_current_user)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error syncing VAPI phone numbers: {str(e)}")
+        logger.error("Unexpected error syncing VAPI phone numbers: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to sync phone numbers: {str(e)}")
 
 
+# Keep-alive client shared by VAPI calls from this module and inbound.py
+_VAPI_HTTP = httpx.AsyncClient(
+    base_url="https://api.vapi.ai",
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+async def close_vapi_client():
+    """Close the shared VAPI client (called on app shutdown)."""
+    await _VAPI_HTTP.aclose()
+
+
+# Backoff (seconds) between retries while VAPI still reports the phone number missing
+_UNLINK_RETRY_DELAYS = (0.5, 1, 2)
+
+
+async def _unlink_phone(assistant_id: str):
+    """Detach the phone number linked to a deleted assistant, in VAPI and in the DB."""
+    try:
+        pool = await get_pg_pool()
+        phone = await pool.fetchrow(
+            "SELECT id, vapi_id FROM phone_numbers WHERE assistant_id = $1 LIMIT 1", assistant_id
+        )
+        if not phone or not phone["vapi_id"]:
+            return
+
+        vapi_key = os.getenv("AI_RECEPTION_VAPI_AUTH_TOKEN")
+        for delay in (*_UNLINK_RETRY_DELAYS, None):
+            resp = await _VAPI_HTTP.patch(
+                f"/phone-number/{phone['vapi_id']}",
+                headers={"Authorization": f"Bearer {vapi_key}", "Content-Type": "application/json"},
+                json={"assistantId": None},
+            )
+            if resp.status_code != 404 or delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        await pool.execute("UPDATE phone_numbers SET assistant_id = NULL WHERE id = $1", phone["id"])
+    except Exception as e:
+        logger.warning("Failed to unlink phone number from assistant %s: %s", assistant_id, e)
+
+
 async def _delete_vapi_assistant(assistant_id: str, vapi_key: str):
     """Best-effort delete of a Vapi assistant"""
     try:
@@ -500,7 +564,7 @@ async def _delete_vapi_assistant(assistant_id: str, vapi_key: str):
                 headers={"Authorization": f"Bearer {vapi_key}"},
             )
     except Exception as e:  # nosec
-        logger.warning(f"Failed to cleanup Vapi assistant {assistant_id}: {e}")
+        logger.warning("Failed to cleanup Vapi assistant %s: %s", assistant_id, e)
 
 
 class ReceptionistCreateRequest(BaseModel):
@@ -549,7 +613,7 @@ VOICE_ID_MAP = {
     "Max": "Elliot",
 }
 
-@router.post("/", response_model=ReceptionistResponse)
+@create_router.post("/", response_model=ReceptionistResponse)
 async def create_receptionist(
     payload: ReceptionistCreateRequest,
     current_user: dict = Depends(get_current_user)
@@ -569,7 +633,6 @@ async def create_receptionist(
     try:
         # Ensure user has organization context
         org_id = current_user.get("organization", {}).get("id")
-        print(f"org_id: {org_id}")
         if not org_id:
             raise HTTPException(status_code=400, detail="User does not belong to any organization")
 
@@ -582,7 +645,7 @@ async def create_receptionist(
         if not org_name or org_name == "CSA":
             try:
                 supabase_tmp = get_supabase_client()
-                org_lookup = supabase_tmp.table("organizations").select("name").eq("id", org_id).single().execute()
+                org_lookup = await run_supabase_async(lambda: supabase_tmp.table("organizations").select("name").eq("id", org_id).single().execute())
                 if org_lookup.data:
                     org_name = org_lookup.data["name"]
             except Exception:
@@ -603,13 +666,13 @@ async def create_receptionist(
                     json=assistant_payload,
                 )
             if vapi_res.status_code >= 400:
-                logger.error(f"Vapi error {vapi_res.status_code}: {vapi_res.text}")
+                logger.error("Vapi error %s: %s", vapi_res.status_code, vapi_res.text)
                 raise HTTPException(status_code=500, detail="Failed to create assistant in Vapi")
 
             assistant_data = vapi_res.json()
             assistant_id = assistant_data.get("id")
         except Exception as e:
-            logger.error(f"Error calling Vapi: {e}")
+            logger.error("Error calling Vapi: %s", e)
             raise HTTPException(status_code=500, detail="Failed to create assistant in Vapi")
 
         supabase = get_supabase_client()
@@ -624,18 +687,18 @@ async def create_receptionist(
         }
 
         try:
-            res = supabase.table("receptionists").insert(insert_data).execute()
+            res = await run_supabase_async(lambda: supabase.table("receptionists").insert(insert_data).execute())
             if not res.data:
                 raise ValueError("Failed to create receptionist record")
         except Exception as db_err:
             # Cleanup assistant in Vapi then propagate
             await _delete_vapi_assistant(assistant_id, vapi_key)
-            logger.error(f"DB insert failed, cleaned Vapi assistant {assistant_id}: {db_err}")
+            logger.error("DB insert failed, cleaned Vapi assistant %s: %s", assistant_id, db_err)
             raise HTTPException(status_code=500, detail="Failed to create receptionist in database") from db_err
 
         # Link phone number -> assistant in Vapi and DB
         if payload.phone_number:
-            phone_row = supabase.table("phone_numbers").select("id,vapi_id").eq("number", payload.phone_number).single().execute()
+            phone_row = await run_supabase_async(lambda: supabase.table("phone_numbers").select("id,vapi_id").eq("number", payload.phone_number).single().execute())
             if phone_row.data and phone_row.data.get("vapi_id"):
                 vapi_phone_id = phone_row.data["vapi_id"]
 
@@ -647,7 +710,7 @@ async def create_receptionist(
                             headers={"Authorization": f"Bearer {vapi_key}", "Content-Type": "application/json"},
                             json={"assistantId": assistant_id},
                         )
-                    supabase.table("phone_numbers").update({"assistant_id": assistant_id}).eq("id", phone_row.data["id"]).execute()
+                    await run_supabase_async(lambda: supabase.table("phone_numbers").update({"assistant_id": assistant_id}).eq("id", phone_row.data["id"]).execute())
 
                 asyncio.create_task(_link_phone())
 
@@ -656,21 +719,20 @@ async def create_receptionist(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error creating receptionist: {str(e)}")
+        logger.error("Unexpected error creating receptionist: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create receptionist: {str(e)}")
 
-@router.get("/get_receptionists", response_model=ReceptionistListResponse)
+@manage_router.get("/get_receptionists", response_model=ReceptionistListResponse)
 async def get_receptionists(current_user: dict = Depends(get_current_user)):
     """Return all receptionists for the user's organization."""
     try:
         org_id = current_user.get("organization", {}).get("id")
-        print(f"org_id12334: {org_id}")
         if not org_id:
             raise HTTPException(status_code=400, detail="User does not belong to any organization")
 
         supabase = get_supabase_client()
-        res = (
-            supabase.table("receptionists")
+        res = await run_supabase_async(
+            lambda: supabase.table("receptionists")
             .select("*")
             .eq("org_id", org_id)
             .eq("is_deleted", False)
@@ -688,10 +750,10 @@ async def get_receptionists(current_user: dict = Depends(get_current_user)):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error fetching receptionists: {str(e)}")
+        logger.error("Unexpected error fetching receptionists: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch receptionists: {str(e)}")
 
-@router.get("/{receptionist_id}", response_model=ReceptionistResponse)
+@manage_router.get("/{receptionist_id}", response_model=ReceptionistResponse)
 async def get_receptionist_by_id(receptionist_id: str, current_user: dict = Depends(get_current_user)):
     """Get a specific receptionist by ID with organization validation."""
     try:
@@ -700,8 +762,8 @@ async def get_receptionist_by_id(receptionist_id: str, current_user: dict = Depe
             raise HTTPException(status_code=400, detail="User does not belong to any organization")
 
         supabase = get_supabase_client()
-        res = (
-            supabase.table("receptionists")
+        res = await run_supabase_async(
+            lambda: supabase.table("receptionists")
             .select("*")
             .eq("id", receptionist_id)
             .eq("org_id", org_id)
@@ -713,13 +775,13 @@ async def get_receptionist_by_id(receptionist_id: str, current_user: dict = Depe
         if not res.data:
             raise HTTPException(status_code=404, detail="Receptionist not found or access denied")
 
-        logger.info(f"Successfully fetched receptionist {receptionist_id} for organization {org_id}")
+        logger.info("Successfully fetched receptionist %s for organization %s", receptionist_id, org_id)
         return ReceptionistResponse(**res.data)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error fetching receptionist {receptionist_id}: {str(e)}")
+        logger.error("Unexpected error fetching receptionist %s: %s", receptionist_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch receptionist: {str(e)}")
 
 class ReceptionistUpdateRequest(BaseModel):
@@ -729,7 +791,7 @@ class ReceptionistUpdateRequest(BaseModel):
     phone_number: Optional[str] = None
 
 
-@router.patch("/{receptionist_id}", response_model=ReceptionistResponse)
+@manage_router.patch("/{receptionist_id}", response_model=ReceptionistResponse)
 async def update_receptionist(receptionist_id: str, payload: ReceptionistUpdateRequest, current_user: dict = Depends(get_current_user)):
     org_id = current_user.get("organization", {}).get("id")
     if not org_id:
@@ -737,7 +799,7 @@ async def update_receptionist(receptionist_id: str, payload: ReceptionistUpdateR
 
     supabase = get_supabase_client()
     # fetch row
-    rec_res = supabase.table("receptionists").select("*").eq("id", receptionist_id).eq("org_id", org_id).single().execute()
+    rec_res = await run_supabase_async(lambda: supabase.table("receptionists").select("*").eq("id", receptionist_id).eq("org_id", org_id).single().execute())
     if not rec_res.data:
         raise HTTPException(status_code=404, detail="Receptionist not found")
 
@@ -767,15 +829,15 @@ async def update_receptionist(receptionist_id: str, payload: ReceptionistUpdateR
     }.items() if v is not None}
 
     if update_dict:
-        supabase.table("receptionists").update(update_dict).eq("id", receptionist_id).execute()
+        await run_supabase_async(lambda: supabase.table("receptionists").update(update_dict).eq("id", receptionist_id).execute())
 
-    final_row = supabase.table("receptionists").select("*").eq("id", receptionist_id).single().execute().data
+    final_row = (await run_supabase_async(lambda: supabase.table("receptionists").select("*").eq("id", receptionist_id).single().execute())).data
     return ReceptionistResponse(**final_row)
 
 class MessageResponse(BaseModel):
     message: str
 
-@router.delete("/{receptionist_id}", response_model=MessageResponse)
+@manage_router.delete("/{receptionist_id}", response_model=MessageResponse)
 async def delete_receptionist(receptionist_id: str, current_user: dict = Depends(get_current_user)):
     """Delete a receptionist belonging to the user's organization."""
     try:
@@ -784,8 +846,8 @@ async def delete_receptionist(receptionist_id: str, current_user: dict = Depends
             raise HTTPException(status_code=400, detail="User does not belong to any organization")
 
         supabase = get_supabase_client()
-        res = (
-            supabase.table("receptionists")
+        res = await run_supabase_async(
+            lambda: supabase.table("receptionists")
             .update({"is_deleted": True})
             .eq("id", receptionist_id)
             .eq("org_id", org_id)
@@ -798,28 +860,12 @@ async def delete_receptionist(receptionist_id: str, current_user: dict = Depends
         # Unlink phone number in background
         assistant_id_del = res.data[0].get("assistant_id") if isinstance(res.data, list) else None
         if assistant_id_del:
-            import asyncio, httpx
-            async def _unlink_phone():
-                supabase_local = get_supabase_client()
-                phone_res = supabase_local.table("phone_numbers").select("id,vapi_id").eq("assistant_id", assistant_id_del).single().execute()
-                if phone_res.data and phone_res.data.get("vapi_id"):
-                    vapi_phone = phone_res.data["vapi_id"]
-                    vapi_key_local = os.getenv("AI_RECEPTION_VAPI_AUTH_TOKEN")
-                    await asyncio.sleep(2)
-                    async with httpx.AsyncClient(timeout=30) as client:
-                        await client.patch(
-                            f"https://api.vapi.ai/phone-number/{vapi_phone}",
-                            headers={"Authorization": f"Bearer {vapi_key_local}", "Content-Type": "application/json"},
-                            json={"assistantId": None},
-                        )
-                    supabase_local.table("phone_numbers").update({"assistant_id": None}).eq("id", phone_res.data["id"]).execute()
-
-            asyncio.create_task(_unlink_phone())
+            asyncio.create_task(_unlink_phone(assistant_id_del))
 
         return MessageResponse(message="Receptionist deleted")
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error deleting receptionist: {str(e)}")
+        logger.error("Unexpected error deleting receptionist: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete receptionist: {str(e)}")
@@ -19,7 +19,7 @@ api_router.include_router(chunks.router, prefix="/chunks", tags=["Chunks Managem
 # Include document processing endpoints
 api_router.include_router(documents.router, prefix="/documents", tags=["Document Processing"])
 # Include receptionist creation endpoints
-api_router.include_router(receptionist.router, prefix="/create_receptionist", tags=["Receptionist Creation"])
+api_router.include_router(receptionist.create_router, prefix="/create_receptionist", tags=["Receptionist Creation"])
 # Include receptionist management endpoints
-api_router.include_router(receptionist.router, prefix="/receptionists", tags=["Receptionist Management"])
+api_router.include_router(receptionist.manage_router, prefix="/receptionists", tags=["Receptionist Management"])
 api_router.include_router(progress.router, prefix="/progress") 
\ No newline at end of file
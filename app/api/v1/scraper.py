@@ -3,12 +3,17 @@ URL Scraping API Endpoints
 Handles web scraping requests and content extraction
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query
 from app.schemas.scraper import UrlScrapeRequest, UrlScrapeResponse, ScrapedContent
 from app.services.scraper_service import WebScraperService
-from app.services.openai_service import OpenAIService
-from app.utils.auth import get_current_user
-from app.database_operations import get_supabase_client
+from app.utils.auth import get_current_user, require_org
+from app.utils.request_body import json_body, json_body_openapi
+from app.db.pool import get_pg_pool
+from app.celery_app import celery_app
+from app.utils.redis_client import redis_client
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+import asyncpg
 import logging
 import time
 from typing import List
@@ -18,34 +23,47 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Web Scraping"])
 
 
-@router.post("/scrape-url")
+def _task_to_dict(row: asyncpg.Record) -> dict:
+    """Convert a scrape_tasks record into the JSON shape PostgREST used to return."""
+    task = dict(row)
+    for key in ("id", "organization_id", "receptionist_id"):
+        if task.get(key) is not None:
+            task[key] = str(task[key])
+    return task
+
+
+async def _clear_task_logs(task_id: str) -> None:
+    """Remove the cached progress log for a deleted task."""
+    try:
+        await redis_client.delete(f"scrape:{task_id}:log")
+        logger.info("Cleaned up Redis logs for task %s", task_id)
+    except Exception as redis_error:
+        logger.warning("Failed to clean up Redis logs: %s", redis_error)
+
+
+@router.post("/scrape-url", openapi_extra=json_body_openapi(UrlScrapeRequest))
 async def scrape_url(
-    request: UrlScrapeRequest,
+    request: UrlScrapeRequest = Depends(json_body(UrlScrapeRequest)),
+    organization_id: str = Depends(require_org),
     current_user: dict = Depends(get_current_user)
 ):
     """Enqueue a background scrape job and return its task_id."""
 
     try:
-        # Identify org / receptionist
-        organization_id = current_user.get("organization", {}).get("id")
-        if not organization_id:
-            raise HTTPException(status_code=400, detail="User has no organization")
-
-        supabase = get_supabase_client()
+        pool = await get_pg_pool()
 
         # Create task row in DB
-        task_row = {
-            "status": "queued",
-            "url": request.url,
-            "organization_id": organization_id,
-            "receptionist_id": request.receptionist_id,
-        }
-        inserted = supabase.table("scrape_tasks").insert(task_row).execute()
-        task_id = inserted.data[0]["id"]
-
-        # Enqueue Celery task (include notify_email from current user)
-        from app.tasks.scrape_tasks import scrape_website
-        scrape_website.delay(
+        task_id = str(await pool.fetchval(
+            "INSERT INTO scrape_tasks (status, url, organization_id, receptionist_id) "
+            "VALUES ('queued', $1, $2, $3) RETURNING id",
+            request.url,
+            organization_id,
+            request.receptionist_id,
+        ))
+
+        # Enqueue Celery task by name (include notify_email from current user);
+        # the web process never imports the task module and its scraper deps
+        celery_app.send_task("app.tasks.scrape_tasks.scrape_website", kwargs=dict(
             task_id=task_id,
             url=request.url,
             receptionist_id=request.receptionist_id,
@@ -54,11 +72,11 @@ async def scrape_url(
             include_subdomains=request.include_subdomains if request.include_subdomains is not None else True,
             include_subpages=request.include_subpages if request.include_subpages is not None else True,
             notify_email=current_user.get("email"),
-        )
+        ))
 
         return {"task_id": task_id, "status": "queued"}
     except Exception as e:
-        logger.error(f"Failed to enqueue scrape: {e}")
+        logger.error("Failed to enqueue scrape: %s", e)
         raise HTTPException(status_code=500, detail="Failed to enqueue scrape task")
 
 
@@ -66,78 +84,79 @@ async def scrape_url(
 
 
 @router.get("/task/{task_id}")
+@cache(expire=2, namespace="task")
 async def get_scrape_task(task_id: str, current_user: dict = Depends(get_current_user)):
     """Return status information for a specific scrape task."""
-    supabase = get_supabase_client()
-    resp = supabase.table("scrape_tasks").select("*").eq("id", task_id).single().execute()
-    if not resp.data:
+    pool = await get_pg_pool()
+    try:
+        row = await pool.fetchrow("SELECT * FROM scrape_tasks WHERE id = $1", task_id)
+    except asyncpg.DataError:
+        row = None  # malformed UUID
+    if row is None:
         raise HTTPException(status_code=404, detail="task not found")
-    return resp.data
+    return _task_to_dict(row)
 
 
 @router.delete("/task/{task_id}")
-async def delete_scrape_task(task_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_scrape_task(
+    task_id: str,
+    background_tasks: BackgroundTasks,
+    organization_id: str = Depends(require_org),
+):
     """Delete a scrape task and clean up Redis logs."""
     try:
-        supabase = get_supabase_client()
-        
-        # Check if task exists and belongs to user's organization
-        resp = supabase.table("scrape_tasks").select("*").eq("id", task_id).single().execute()
-        if not resp.data:
+        pool = await get_pg_pool()
+
+        # Ownership check and delete in one statement; a task in another org
+        # is reported as not found so its existence isn't leaked.
+        try:
+            deleted_id = await pool.fetchval(
+                "DELETE FROM scrape_tasks WHERE id = $1 AND organization_id = $2 RETURNING id",
+                task_id,
+                organization_id,
+            )
+        except asyncpg.DataError:
+            deleted_id = None  # malformed UUID
+        if deleted_id is None:
             raise HTTPException(status_code=404, detail="Task not found")
-        
-        organization_id = current_user.get("organization", {}).get("id")
-        if resp.data.get("organization_id") != organization_id:
-            raise HTTPException(status_code=403, detail="Not authorized to delete this task")
-        
-        # Delete from database
-        supabase.table("scrape_tasks").delete().eq("id", task_id).execute()
-        
-        # Clean up Redis logs
+
+        # Drop cached task/active-task responses so the deleted task isn't served
         try:
-            import redis
-            from app.config.settings import REDIS_URL
-            r = redis.from_url(REDIS_URL)
-            channel = f"scrape:{task_id}"
-            # Remove the log list
-            r.delete(f"{channel}:log")
-            logger.info(f"Cleaned up Redis logs for task {task_id}")
-        except Exception as redis_error:
-            logger.warning(f"Failed to clean up Redis logs: {redis_error}")
+            await FastAPICache.clear(namespace="task")
+        except Exception as cache_error:
+            logger.warning("Failed to clear task cache: %s", cache_error)
+        
+        # Clean up Redis logs after the response is sent
+        background_tasks.add_task(_clear_task_logs, task_id)
         
         return {"message": f"Task {task_id} deleted successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete task {task_id}: {e}")
+        logger.error("Failed to delete task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Failed to delete task")
 
 
 @router.get("/active-task")
+@cache(expire=2, namespace="task")
 async def get_active_task(
     receptionist_id: str = Query(None, description="Filter by receptionist"),
-    current_user: dict = Depends(get_current_user),
+    organization_id: str = Depends(require_org),
 ):
     """Return the most recent task in queued/in_progress for org or receptionist."""
-    organization_id = current_user.get("organization", {}).get("id")
-    if not organization_id:
-        raise HTTPException(status_code=400, detail="User has no organization")
-
-    supabase = get_supabase_client()
-    q = (
-        supabase.table("scrape_tasks")
-        .select("*")
-        .eq("organization_id", organization_id)
-        .in_("status", ["queued", "in_progress"])
-        .order("created_at", desc=True)
-        .limit(1)
+    pool = await get_pg_pool()
+    # Served by the partial index scrape_tasks_active_idx (13_scrape_tasks_active_index.sql)
+    row = await pool.fetchrow(
+        "SELECT id, status, url, receptionist_id, created_at, started_at FROM scrape_tasks "
+        "WHERE organization_id = $1 AND status IN ('queued', 'in_progress') "
+        "AND ($2::uuid IS NULL OR receptionist_id = $2::uuid) "
+        "ORDER BY created_at DESC LIMIT 1",
+        organization_id,
+        receptionist_id,
     )
-    if receptionist_id:
-        q = q.eq("receptionist_id", receptionist_id)
-    resp = q.execute()
-    if resp.data:
-        return resp.data[0]
+    if row is not None:
+        return _task_to_dict(row)
     return {"status": "idle"}
 
 
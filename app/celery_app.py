@@ -1,5 +1,6 @@
+import os
 from celery import Celery
-from app.config.settings import REDIS_URL, ENV
+from app.config.settings import REDIS_URL, ENV, CELERY_WORKER_CONCURRENCY
 
 celery_app = Celery(
     "ai_receptionist",
@@ -7,11 +8,23 @@ celery_app = Celery(
     backend=REDIS_URL,
 )
 
+# Redis connection options shared by the broker and result backend. Pools are
+# redis.connection.ConnectionPool, which raises ConnectionError once
+# max_connections is reached; switch to BlockingConnectionPool if that shows up.
+_REDIS_TRANSPORT_OPTIONS = {
+    "max_connections": 20,
+    "socket_keepalive": True,
+    "health_check_interval": 60,
+    "retry_on_timeout": True,
+}
+
 # Basic Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    result_serializer="json",
-    accept_content=["json"],
+    # msgpack: smaller, faster payloads; json still accepted for messages
+    # queued by older workers during rollout
+    task_serializer="msgpack",
+    result_serializer="msgpack",
+    accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
     task_default_queue="ai_receptionist_default",
@@ -23,13 +36,31 @@ celery_app.conf.update(
     # Fix for Celery 6.0+ compatibility
     broker_connection_retry_on_startup=True,
     broker_connection_retry=True,
+    # Bounded, reused Redis connections instead of a new TCP+AUTH per publish
+    worker_concurrency=CELERY_WORKER_CONCURRENCY,
+    broker_pool_limit=min(CELERY_WORKER_CONCURRENCY, 10),
+    redis_max_connections=20,
+    broker_transport_options={
+        **_REDIS_TRANSPORT_OPTIONS,
+        "socket_keepalive_options": {},
+        "visibility_timeout": 43200,
+    },
+    result_backend_transport_options=_REDIS_TRANSPORT_OPTIONS,
+    # Keep stored results small and short-lived; task progress lives in
+    # scrape_tasks / Redis logs, not in Celery results
+    result_compression="gzip",
+    result_expires=3600,
+    result_extended=False,
 )
 
 # Ensure all task modules inside app.tasks are imported so workers register them
 celery_app.autodiscover_tasks(['app'])
 
-# Explicit import to guarantee registration when autodiscover fails in some environments.
-import app.tasks.scrape_tasks  # noqa: F401
+# Explicit import to guarantee registration when autodiscover fails in some
+# environments. Only workers need it (they set CELERY_WORKER_RUNNING=1); the
+# web process enqueues by task name and skips the heavy scraper imports.
+if os.getenv("CELERY_WORKER_RUNNING") == "1":
+    import app.tasks.scrape_tasks  # noqa: F401
 
 # Helpful for local dev
 if ENV == "development":
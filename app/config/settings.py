@@ -1,7 +1,11 @@
+import logging
 import os
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # First get the environment from ENV variable or default to 'development'
 ENV = os.getenv('ENV', 'development')
 
@@ -13,7 +17,7 @@ def load_env_file():
     # First try to load .env.{ENV} file
     env_file = BASE_DIR / f".env.{ENV}"
     if env_file.exists():
-        print(f"Loading environment from {env_file}")
+        logger.debug("Loading environment from %s", env_file)
         # Force override existing environment variables
         load_dotenv(dotenv_path=env_file, override=True)
         return True
@@ -21,22 +25,27 @@ def load_env_file():
     # Fallback to the standard .env file
     default_env_file = BASE_DIR / ".env"
     if default_env_file.exists():
-        print(f"Loading environment from {default_env_file}")
+        logger.debug("Loading environment from %s", default_env_file)
         # Force override existing environment variables
         load_dotenv(dotenv_path=default_env_file, override=True)
         return True
     
     # If no env file found
-    print(f"Warning: No .env.{ENV} or .env file found")
+    logger.debug("No .env.%s or .env file found", ENV)
     return False
 
-# Load environment variables
-env_file_loaded = load_env_file()
+# Load environment variables once per process. The marker survives module
+# reloads (uvicorn --reload, tests) so the .env file isn't re-parsed each time.
+_ENV_LOADED_MARKER = "_AI_RECEPTION_ENV_FILE_LOADED"
+if _ENV_LOADED_MARKER in os.environ:
+    env_file_loaded = os.environ[_ENV_LOADED_MARKER] == "1"
+else:
+    env_file_loaded = load_env_file()
+    os.environ[_ENV_LOADED_MARKER] = "1" if env_file_loaded else "0"
 
-# Print environment for debugging
-print(f"Running in {ENV} environment")
+logger.debug("Running in %s environment", ENV)
 if not env_file_loaded:
-    print("No .env file found - using environment variables from Azure Key Vault")
+    logger.debug("No .env file found - using environment variables from Azure Key Vault")
 
 
 # Main
@@ -47,6 +56,8 @@ version=os.getenv("version_AIR", "1.0.0")
 SUPABASE_URL=os.getenv("AI_RECEPTION_SUPABASE_URL")
 SUPABASE_KEY=os.getenv("AI_RECEPTION_SUPABASE_KEY")
 SUPABASE_SERVICE_ROLE_KEY=os.getenv("AI_RECEPTION_SUPABASE_SERVICE_ROLE_KEY")
+# Direct Postgres connection string (Supabase pooler) used by app/db/pool.py
+DATABASE_URL=os.getenv("AI_RECEPTION_DATABASE_URL")
 
 # Environment-specific Supabase configurations for migrations
 SUPABASE_URL_DEV=os.getenv("SUPABASE_URL_DEV")
@@ -71,6 +82,7 @@ MAX_CHUNKS_PER_URL = int(os.getenv('MAX_CHUNKS_PER_URL', '10'))  # 1 chunk per U
 
 # Asynchronous task queue (Celery)
 REDIS_URL=os.getenv('AI_RECEPTION_REDIS_URL', 'redis://localhost:6379/0')
+CELERY_WORKER_CONCURRENCY=int(os.getenv('AI_RECEPTION_CELERY_CONCURRENCY', '2'))
 
 API_V1_STR=os.getenv('AI_RECEPTION_API_V1_STR', '/api/v1')
 HOST=os.getenv('AI_RECEPTION_HOST', '0.0.0.0')
@@ -78,6 +90,28 @@ PORT=int(os.getenv('AI_RECEPTION_PORT', '8000'))
 LOG_LEVEL=os.getenv('AI_RECEPTION_LOG_LEVEL', 'INFO')
 DEBUG=os.getenv('AI_RECEPTION_DEBUG', 'true').lower() in ('true', '1', 'yes', 'on')
 
+# Frontend origins allowed by the CORS middleware
+_DEFAULT_CORS_ORIGINS = (
+    "http://localhost:8080",
+    "http://localhost:8081",
+    "http://127.0.0.1:8080",
+    "http://localhost:3000",  # React default port
+    "http://127.0.0.1:3000",
+    "http://localhost:5173",  # Vite default port
+    "http://127.0.0.1:5173",
+    "https://myaireceptionist.indrasol.com",
+)
+
+
+def _parse_cors(value: Optional[str]) -> Tuple[str, ...]:
+    """Comma-separated origins from the environment, or the defaults if unset"""
+    if not value:
+        return _DEFAULT_CORS_ORIGINS
+    return tuple(origin.strip() for origin in value.split(",") if origin.strip())
+
+
+BACKEND_CORS_ORIGINS=_parse_cors(os.getenv('AI_RECEPTION_CORS_ORIGINS'))
+
 # Email settings (used for scrape completion notice)
 EMAIL_HOST=os.getenv('EMAIL_HOST')
 EMAIL_PORT=int(os.getenv('EMAIL_PORT', '587')) if os.getenv('EMAIL_PORT') else None
@@ -94,4 +128,4 @@ SENDGRID_TEMPLATE_SCRAPE_COMPLETE=os.getenv('SENDGRID_TEMPLATE_SCRAPE_COMPLETE',
 # Brand defaults (used in emails; can be overridden per message)
 BRAND_NAME=os.getenv('BRAND_NAME', 'AI Receptionist')
 BRAND_LOGO_URL=os.getenv('BRAND_LOGO_URL', 'https://myaireceptionist.indrasol.com/lovable-uploads/ai_logo.png')
-BRAND_PRIMARY_COLOR=os.getenv('BRAND_PRIMARY_COLOR', '#2563eb')
\ No newline at end of file
+BRAND_PRIMARY_COLOR=os.getenv('BRAND_PRIMARY_COLOR', '#2563eb')
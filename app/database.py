@@ -1,10 +1,14 @@
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from app.config.settings import SUPABASE_URL, SUPABASE_KEY, SUPABASE_SERVICE_ROLE_KEY
 from fastapi import HTTPException
-from functools import lru_cache
+import threading
 import asyncio
 import time
 import logging
+import anyio
+import httpx
+from typing import Optional
 from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
@@ -17,24 +21,88 @@ def log_debugger(message: str):
 # Global thread pool for running Supabase operations asynchronously
 thread_pool = ThreadPoolExecutor()
 
-# Initialize Supabase client
-@lru_cache
-def get_supabase_client():
-    # Prefer service role key on the server for privileged operations (e.g., storage uploads)
-    # Fallback to public anon key if service key is not configured
-    key_to_use = SUPABASE_SERVICE_ROLE_KEY or SUPABASE_KEY
-    log_debugger(f"SUPABASE_URL: {SUPABASE_URL}")
-    # Avoid logging the actual secret value
-    which_key = "anon" if SUPABASE_KEY else "service"
-    log_debugger(f"Using Supabase key type: {which_key}")
-    supbase: Client = create_client(SUPABASE_URL, key_to_use)
-    return supbase
-
-# Helper to run Supabase operations asynchronously
-async def run_supabase_async(func):
-    return await asyncio.get_event_loop().run_in_executor(
-        thread_pool, func
+# Caps how many blocking supabase-py calls run in worker threads at once, so a
+# burst of requests can't exhaust the thread pool or Supabase connections
+_DB_LIMITER = anyio.CapacityLimiter(20)
+
+# Connection pool shared by every PostgREST call in this process
+POSTGREST_TIMEOUT_SECONDS = 10
+POSTGREST_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+
+def _use_pooled_postgrest_session(client: Client) -> None:
+    """Swap the PostgREST session for one with explicit keep-alive limits so
+    TCP/TLS connections are reused across requests."""
+    old_session = client.postgrest.session
+    client.postgrest.session = httpx.Client(
+        base_url=old_session.base_url,
+        headers=old_session.headers,
+        timeout=POSTGREST_TIMEOUT_SECONDS,
+        limits=POSTGREST_LIMITS,
+        follow_redirects=True,
+        http2=True,
+    )
+    old_session.close()
+
+
+# Process-wide Supabase client, created lazily on first use
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def _create_supabase_client(key: str) -> Client:
+    client: Client = create_client(
+        SUPABASE_URL,
+        key,
+        options=ClientOptions(postgrest_client_timeout=POSTGREST_TIMEOUT_SECONDS),
     )
+    _use_pooled_postgrest_session(client)
+    return client
+
+
+def get_supabase_client() -> Client:
+    global _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            # Prefer service role key on the server for privileged operations (e.g., storage uploads)
+            # Fallback to public anon key if service key is not configured
+            key_to_use = SUPABASE_SERVICE_ROLE_KEY or SUPABASE_KEY
+            log_debugger(f"SUPABASE_URL: {SUPABASE_URL}")
+            # Avoid logging the actual secret value
+            which_key = "service" if SUPABASE_SERVICE_ROLE_KEY else "anon"
+            log_debugger(f"Using Supabase key type: {which_key}")
+            _client = _create_supabase_client(key_to_use)
+    return _client
+
+
+def get_supabase_admin_client() -> Client:
+    """Client authenticated with the service role key (auth admin API, RLS bypass)."""
+    if not SUPABASE_SERVICE_ROLE_KEY:
+        raise RuntimeError("AI_RECEPTION_SUPABASE_SERVICE_ROLE_KEY is not configured")
+    # get_supabase_client() already uses the service role key when it is set
+    return get_supabase_client()
+
+
+def close_supabase_client():
+    """Close the shared PostgREST connection pool (called on app shutdown)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            return
+        try:
+            _client.postgrest.session.close()
+        except Exception as e:
+            logger.warning("Failed to close Supabase client: %s", e)
+        _client = None
+
+# Helper to run Supabase operations asynchronously, bounded by _DB_LIMITER
+async def run_supabase_async(func):
+    async with _DB_LIMITER:
+        return await asyncio.get_event_loop().run_in_executor(
+            thread_pool, func
+        )
 
 # Helper for safer Supabase operations with error handling
 async def safe_supabase_operation(operation, error_message="Supabase operation failed", retries: int = 3, backoff_seconds: float = 0.25):
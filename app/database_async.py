@@ -0,0 +1,83 @@
+"""
+Async PostgREST access for request handlers.
+
+supabase-py's client is synchronous, so every ``.execute()`` inside an
+``async def`` either blocks the event loop or occupies a worker thread. Reads on
+hot paths go straight to PostgREST over a shared ``httpx.AsyncClient`` instead;
+HTTP/2 lets concurrent requests multiplex over the same connection.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.config.settings import SUPABASE_URL, SUPABASE_KEY, SUPABASE_SERVICE_ROLE_KEY
+from app.database import POSTGREST_LIMITS, POSTGREST_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Process-wide client, created lazily on first use (same key choice as get_supabase_client)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_postgrest_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        key = SUPABASE_SERVICE_ROLE_KEY or SUPABASE_KEY
+        _client = httpx.AsyncClient(
+            base_url=f"{SUPABASE_URL}/rest/v1",
+            headers={
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+                "Accept": "application/json",
+            },
+            timeout=POSTGREST_TIMEOUT_SECONDS,
+            limits=POSTGREST_LIMITS,
+            http2=True,
+        )
+    return _client
+
+
+async def postgrest_select(table: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    GET rows from a PostgREST table
+
+    Args:
+        table: Table name
+        params: PostgREST query params, e.g. {"select": "*", "organization_id": "eq.<id>"}
+
+    Returns:
+        List of rows; raises httpx.HTTPStatusError on a non-2xx response
+    """
+    response = await get_postgrest_client().get(f"/{table}", params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+async def postgrest_rpc(function: str, payload: Dict[str, Any]) -> Any:
+    """
+    Call a Postgres function exposed by PostgREST
+
+    Args:
+        function: Function name in the public schema
+        payload: Named arguments, e.g. {"p_username": "alice"}
+
+    Returns:
+        The decoded JSON result; raises httpx.HTTPStatusError on a non-2xx response
+    """
+    response = await get_postgrest_client().post(f"/rpc/{function}", json=payload)
+    response.raise_for_status()
+    return response.json()
+
+
+async def close_postgrest_client() -> None:
+    """Close the shared async PostgREST connection pool (called on app shutdown)."""
+    global _client
+    if _client is None:
+        return
+    try:
+        await _client.aclose()
+    except Exception as e:
+        logger.warning("Failed to close async PostgREST client: %s", e)
+    _client = None
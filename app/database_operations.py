@@ -2,61 +2,112 @@
 Database operations for AI Receptionist API
 """
 
+import asyncio
+import heapq
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
-from app.database import get_supabase_client
+import operator
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+from cachetools import TTLCache
+from app.database import get_supabase_client, run_supabase_async
+from app.database_async import postgrest_select
 from app.config.settings import SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, SUPABASE_JWT_SECRET
 
 logger = logging.getLogger(__name__)
 
-async def save_inbound_call_data(call_data: Dict[str, Any], organization_id: str) -> Optional[Dict[str, Any]]:
+# Organization rows looked up by name (e.g. the default "CSA" org). They almost
+# never change, so a short TTL avoids a Supabase round-trip per lookup.
+_org_by_name_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+# Organization rows keyed by id, for the organization_id carried in JWT claims
+_org_by_id_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+# Users whose metadata was recently set by ensure_user_organization; dedupes the
+# admin API call during login bursts
+_recently_ensured_users: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+
+def _utc_now_iso() -> str:
+    """Timezone-aware UTC timestamp for updated_at columns"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+# Columns copied verbatim from the webhook's call_data into ai_receptionist_inbound_calls
+_CALL_FIELDS = (
+    "vapi_call_id",
+    "call_status",
+    "call_summary",
+    "call_recording_url",
+    "call_transcript",
+    "success_evaluation",
+    "call_type",
+    "call_duration_seconds",
+    "call_cost",
+    "ended_reason",
+    "customer_number",
+    "phone_number_id",
+)
+_CALL_FIELD_DEFAULTS = {"call_status": "completed", "call_type": "inboundPhoneCall"}
+
+
+def _build_inbound_call_record(call_data: Dict[str, Any], organization_id: str, updated_at: str) -> Dict[str, Any]:
+    """Row for ai_receptionist_inbound_calls from a VAPI webhook's call_data"""
+    record = {k: call_data.get(k, _CALL_FIELD_DEFAULTS.get(k)) for k in _CALL_FIELDS}
+    record.update(
+        phone_number=call_data.get("customer_number", ""),
+        organization_id=organization_id,
+        updated_at=updated_at,
+    )
+    return record
+
+
+async def save_inbound_calls_batch(calls: List[Dict[str, Any]], organization_id: str) -> List[Dict[str, Any]]:
     """
-    Save inbound call data to ai_receptionist_inbound_calls table
+    Save several inbound calls to ai_receptionist_inbound_calls in one insert
     
     Args:
-        call_data: Call data from VAPI webhook
-        organization_id: Organization ID to associate with the call
+        calls: Call data dicts from VAPI webhooks
+        organization_id: Organization ID to associate with the calls
         
     Returns:
-        Saved call record or None if failed
+        Saved call records (empty list if none were saved)
     """
+    if not calls:
+        return []
     try:
         supabase = get_supabase_client()
         table_name = "ai_receptionist_inbound_calls"
         
-        # Extract data from call_data
-        inbound_call_record = {
-            "phone_number": call_data.get("customer_number", ""),
-            "organization_id": organization_id,
-            "vapi_call_id": call_data.get("vapi_call_id"),
-            "call_status": call_data.get("call_status", "completed"),
-            "call_summary": call_data.get("call_summary"),
-            "call_recording_url": call_data.get("call_recording_url"),
-            "call_transcript": call_data.get("call_transcript"),
-            "success_evaluation": call_data.get("success_evaluation"),
-            "call_type": call_data.get("call_type", "inboundPhoneCall"),
-            "call_duration_seconds": call_data.get("call_duration_seconds"),
-            "call_cost": call_data.get("call_cost"),
-            "ended_reason": call_data.get("ended_reason"),
-            "customer_number": call_data.get("customer_number"),
-            "phone_number_id": call_data.get("phone_number_id"),
-            "updated_at": datetime.utcnow().isoformat()
-        }
+        updated_at = _utc_now_iso()
+        records = [_build_inbound_call_record(call_data, organization_id, updated_at) for call_data in calls]
         
-        # Insert the record
-        result = supabase.table(table_name).insert(inbound_call_record).execute()
+        # Single POST for the whole batch
+        result = await run_supabase_async(lambda: supabase.table(table_name).insert(records).execute())
         
         if result.data:
-            logger.info(f"Successfully saved inbound call data for call ID: {call_data.get('vapi_call_id')} to {table_name}")
-            return result.data[0]
+            logger.info(f"Successfully saved {len(result.data)} inbound call(s) to {table_name}")
+            return result.data
         else:
-            logger.warning("No data returned when saving inbound call")
-            return None
+            logger.warning("No data returned when saving inbound calls")
+            return []
             
     except Exception as e:
         logger.error(f"Failed to save inbound call data: {str(e)}")
-        return None
+        return []
+
+
+async def save_inbound_call_data(call_data: Dict[str, Any], organization_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Save inbound call data to ai_receptionist_inbound_calls table
+    
+    Args:
+        call_data: Call data from VAPI webhook
+        organization_id: Organization ID to associate with the call
+        
+    Returns:
+        Saved call record or None if failed
+    """
+    saved = await save_inbound_calls_batch([call_data], organization_id)
+    return saved[0] if saved else None
+
 
 async def update_outbound_call_data(call_data: Dict[str, Any], organization_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -81,13 +132,15 @@ async def update_outbound_call_data(call_data: Dict[str, Any], organization_id:
             "call_transcript": call_data.get("call_transcript"),
             "success_evaluation": call_data.get("success_evaluation"),
             "organization_id": organization_id,
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": _utc_now_iso()
         }
         
         # Find lead by vapi_call_id and update
         vapi_call_id = call_data.get("vapi_call_id")
         if vapi_call_id:
-            result = supabase.table(table_name).update(update_data).eq("vapi_call_id", vapi_call_id).execute()
+            result = await run_supabase_async(
+                lambda: supabase.table(table_name).update(update_data).eq("vapi_call_id", vapi_call_id).execute()
+            )
             
             if result.data:
                 logger.info(f"Successfully updated outbound call data for VAPI call ID: {vapi_call_id}")
@@ -103,6 +156,24 @@ async def update_outbound_call_data(call_data: Dict[str, Any], organization_id:
         logger.error(f"Failed to update outbound call data: {str(e)}")
         return None
 
+async def _fetch_organization_by_name(org_name: str) -> Optional[Dict[str, Any]]:
+    rows = await postgrest_select(
+        "organizations",
+        {"select": "id,name,description", "name": f"eq.{org_name}", "limit": "1"},
+    )
+    return rows[0] if rows else None
+
+
+async def _get_organization_by_name(org_name: str) -> Optional[Dict[str, Any]]:
+    """Organization row by name, served from the TTL cache when possible"""
+    org = _org_by_name_cache.get(org_name)
+    if org is None:
+        org = await _fetch_organization_by_name(org_name)
+        if org is not None:
+            _org_by_name_cache[org_name] = org
+    return org
+
+
 async def get_organization_id_by_name(org_name: str) -> Optional[str]:
     """
     Get organization ID by name
@@ -114,12 +185,10 @@ async def get_organization_id_by_name(org_name: str) -> Optional[str]:
         Organization ID or None if not found
     """
     try:
-        supabase = get_supabase_client()
+        org = await _get_organization_by_name(org_name)
         
-        result = supabase.table("organizations").select("id").eq("name", org_name).execute()
-        
-        if result.data:
-            return result.data[0]["id"]
+        if org:
+            return org["id"]
         else:
             logger.warning(f"Organization not found: {org_name}")
             return None
@@ -140,12 +209,10 @@ async def get_organization_by_vapi_org_id(vapi_org_id: str) -> Optional[Dict[str
         Organization info or None if not found
     """
     try:
-        supabase = get_supabase_client()
-        
-        result = supabase.table("organizations").select("*").eq("vapi_org_id", vapi_org_id).execute()
+        rows = await postgrest_select("organizations", {"select": "*", "vapi_org_id": f"eq.{vapi_org_id}"})
         
-        if result.data:
-            return result.data[0]
+        if rows:
+            return rows[0]
         else:
             logger.warning(f"Organization not found with VAPI org ID: {vapi_org_id}")
             return None
@@ -154,6 +221,58 @@ async def get_organization_by_vapi_org_id(vapi_org_id: str) -> Optional[Dict[str
         logger.error(f"Failed to get organization by VAPI org ID: {str(e)}")
         return None
 
+
+_CALL_TABLES = {
+    "inbound": "ai_receptionist_inbound_calls",
+    "outbound": "ai_receptionist_leads",
+}
+
+
+# Columns returned by the call list queries. Transcripts and recording URLs can
+# be several KB per row, so they're left to the single-call detail lookup.
+# created_at is required for ordering/merging.
+_CALL_LIST_COLUMNS = {
+    "inbound": "id,created_at,phone_number,vapi_call_id,call_type,call_status,call_summary,call_duration_seconds,call_cost,ended_reason",
+    "outbound": "id,created_at,first_name,last_name,phone_number,vapi_call_id,call_status,call_summary,success_evaluation",
+}
+
+
+_created_at = operator.itemgetter("created_at")
+
+
+def _merge_calls(inbound_rows: Optional[list], outbound_rows: Optional[list]) -> list:
+    """Tag rows with call_type and merge two created_at-desc lists into one (O(n), no re-sort)."""
+    inbound_calls = [{**call, "call_type": "inbound"} for call in inbound_rows or ()]
+    outbound_calls = [{**call, "call_type": "outbound"} for call in outbound_rows or ()]
+    return list(heapq.merge(inbound_calls, outbound_calls, key=_created_at, reverse=True))
+
+
+async def _fetch_org_calls_via_profile(user_id: str, call_types: list) -> Optional[Dict[str, list]]:
+    """
+    Fetch a user's organization calls in one PostgREST request by embedding
+    profiles -> organizations -> call tables.
+
+    Returns:
+        Mapping of call type to its rows (newest first), or None if the user
+        has no organization
+    """
+    query_col = "user_id" if "@" not in user_id else "email"
+    embeds = ",".join(f"{_CALL_TABLES[t]}({_CALL_LIST_COLUMNS[t]})" for t in call_types)
+    params = {
+        "select": f"organization_id,organizations({embeds})",
+        query_col: f"eq.{user_id}",
+        "limit": "1",
+    }
+    for t in call_types:
+        params[f"organizations.{_CALL_TABLES[t]}.order"] = "created_at.desc"
+    rows = await postgrest_select("profiles", params)
+
+    if not rows or not rows[0].get("organization_id"):
+        return None
+    org = rows[0].get("organizations") or {}
+    return {t: org.get(_CALL_TABLES[t]) or [] for t in call_types}
+
+
 async def get_calls_by_organization(organization_id: str, call_type: str = None) -> list:
     """
     Get calls for a specific organization
@@ -166,39 +285,23 @@ async def get_calls_by_organization(organization_id: str, call_type: str = None)
         List of calls
     """
     try:
-        supabase = get_supabase_client()
+        def params(t: str) -> Dict[str, str]:
+            return {
+                "select": _CALL_LIST_COLUMNS[t],
+                "organization_id": f"eq.{organization_id}",
+                "order": "created_at.desc",
+            }
         
-        if call_type == "inbound":
-            # Get inbound calls
-            table_name = "ai_receptionist_inbound_calls"
-            result = supabase.table(table_name).select("*").eq("organization_id", organization_id).order("created_at", desc=True).execute()
-        elif call_type == "outbound":
-            # Get outbound calls (leads)
-            table_name = "ai_receptionist_leads"
-            result = supabase.table(table_name).select("*").eq("organization_id", organization_id).order("created_at", desc=True).execute()
-        else:
-            # Get all calls
-            inbound_table_name = "ai_receptionist_inbound_calls"
-            inbound_result = supabase.table(inbound_table_name).select("*").eq("organization_id", organization_id).execute()
-            outbound_result = supabase.table("ai_receptionist_leads").select("*").eq("organization_id", organization_id).execute()
-            
-            # Combine and sort by created_at
-            all_calls = []
-            if inbound_result.data:
-                for call in inbound_result.data:
-                    call["call_type"] = "inbound"
-                    all_calls.append(call)
-                    
-            if outbound_result.data:
-                for call in outbound_result.data:
-                    call["call_type"] = "outbound"
-                    all_calls.append(call)
-            
-            # Sort by created_at
-            all_calls.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-            return all_calls
+        if call_type in _CALL_TABLES:
+            # Get inbound calls or outbound calls (leads)
+            return await postgrest_select(_CALL_TABLES[call_type], params(call_type))
         
-        return result.data if result.data else []
+        # Get all calls: query both tables concurrently, each already ordered newest first
+        inbound_rows, outbound_rows = await asyncio.gather(
+            postgrest_select(_CALL_TABLES["inbound"], params("inbound")),
+            postgrest_select(_CALL_TABLES["outbound"], params("outbound")),
+        )
+        return _merge_calls(inbound_rows, outbound_rows)
         
     except Exception as e:
         logger.error(f"Failed to get calls by organization: {str(e)}")
@@ -213,15 +316,13 @@ async def get_default_organization() -> Optional[Dict[str, Any]]:
         CSA organization info or None if not found
     """
     try:
-        supabase = get_supabase_client()
+        org = await _get_organization_by_name("CSA")
         
-        result = supabase.table("organizations").select("*").eq("name", "CSA").execute()
-        
-        if result.data:
+        if org:
             return {
-                "id": result.data[0]["id"],
+                "id": org["id"],
                 "name": "CSA",
-                "description": result.data[0].get("description", ""),
+                "description": org.get("description") or "",
                 "role": "member"
             }
         else:
@@ -248,17 +349,23 @@ async def get_user_organization_from_claims(user_claims: dict) -> Optional[Dict[
         org_id = user_claims.get("organization_id")
         org_name = user_claims.get("organization_name")
         if org_id:
-            # Get organization details from database
-            supabase = get_supabase_client()
-            org_result = supabase.table("organizations").select("*").eq("id", org_id).execute()
+            # Get organization details (cached; the row rarely changes)
+            org_row = _org_by_id_cache.get(org_id)
+            if org_row is None:
+                org_rows = await postgrest_select(
+                    "organizations",
+                    {"select": "name,description", "id": f"eq.{org_id}", "limit": "1"},
+                )
+                if org_rows:
+                    org_row = org_rows[0]
+                    _org_by_id_cache[org_id] = org_row
             
-            if org_result.data:
-                db_name = org_result.data[0]["name"]
-                logger.info(f"Found organization {db_name} for user from JWT claims")
+            if org_row:
+                logger.debug("Found organization %s for user from JWT claims", org_row["name"])
                 return {
                     "id": org_id,
-                    "name": db_name,
-                    "description": org_result.data[0].get("description", ""),
+                    "name": org_row["name"],
+                    "description": org_row.get("description") or "",
                     "role": "member"
                 }
         
@@ -282,20 +389,23 @@ async def get_user_organization(user_id: str, user_claims: dict = None) -> Optio
         Organization info or None if not found
     """
     try:
-        supabase = get_supabase_client()
         query_col = "user_id" if "@" not in user_id else "email"
-        prof_resp = (
-            supabase.table("profiles")
-            .select("organization_id, organizations(name, description)")
-            .eq(query_col, user_id)
-            .single()
-            .execute()
+        # limit=1 rather than a single-object request: a user without a profile
+        # row is a normal case and shouldn't go through PostgREST's 406 error path
+        prof_rows = await postgrest_select(
+            "profiles",
+            {
+                "select": "organization_id,organizations(name,description)",
+                query_col: f"eq.{user_id}",
+                "limit": "1",
+            },
         )
-        logger.debug(f"Profile org lookup response: {prof_resp}")
+        logger.debug("Profile org lookup response: %s", prof_rows)
+        profile = prof_rows[0] if prof_rows else None
 
-        if prof_resp.data and prof_resp.data.get("organization_id"):
-            org_id_row = prof_resp.data["organization_id"]
-            org_obj = prof_resp.data.get("organizations") or {}
+        if profile and profile.get("organization_id"):
+            org_id_row = profile["organization_id"]
+            org_obj = profile.get("organizations") or {}
             return {
                 "id": org_id_row,
                 "name": org_obj.get("name", "Organization"),
@@ -324,15 +434,15 @@ async def get_calls_by_user_organization(user_id: str, call_type: str = None, us
         List of calls
     """
     try:
-        # First get user's organization
-        user_org = await get_user_organization(user_id, user_claims)
-        if not user_org:
+        # Organization lookup and calls in a single request
+        call_types = [call_type] if call_type in _CALL_TABLES else ["inbound", "outbound"]
+        calls = await _fetch_org_calls_via_profile(user_id, call_types)
+        if calls is None:
             return []
         
-        organization_id = user_org["id"]
-        
-        # Then get calls for that organization
-        return await get_calls_by_organization(organization_id, call_type)
+        if call_type in _CALL_TABLES:
+            return calls[call_type]
+        return _merge_calls(calls["inbound"], calls["outbound"])
         
     except Exception as e:
         logger.error(f"Failed to get calls by user organization: {str(e)}")
@@ -351,20 +461,9 @@ async def get_inbound_calls_by_user_organization(user_id: str, user_claims: dict
         List of inbound calls
     """
     try:
-        # First get user's organization
-        user_org = await get_user_organization(user_id, user_claims)
-        if not user_org:
-            return []
-        
-        organization_id = user_org["id"]
-        
-        # Get inbound calls for that organization
-        supabase = get_supabase_client()
-        table_name = "ai_receptionist_inbound_calls"
-        
-        result = supabase.table(table_name).select("*").eq("organization_id", organization_id).order("created_at", desc=True).execute()
-        
-        return result.data if result.data else []
+        # Organization lookup and inbound calls in a single request
+        calls = await _fetch_org_calls_via_profile(user_id, ["inbound"])
+        return calls["inbound"] if calls else []
         
     except Exception as e:
         logger.error(f"Failed to get inbound calls by user organization: {str(e)}")
@@ -383,15 +482,17 @@ async def get_inbound_call_by_id_and_org(call_id: str, organization_id: str) ->
         Inbound call data or None if not found
     """
     try:
-        supabase = get_supabase_client()
         table_name = "ai_receptionist_inbound_calls"
         
         # Get the specific call and verify organization ownership
-        result = supabase.table(table_name).select("*").eq("id", call_id).eq("organization_id", organization_id).execute()
+        rows = await postgrest_select(
+            table_name,
+            {"select": "*", "id": f"eq.{call_id}", "organization_id": f"eq.{organization_id}"},
+        )
         
-        if result.data:
+        if rows:
             logger.info(f"Found inbound call {call_id} for organization {organization_id}")
-            return result.data[0]
+            return rows[0]
         else:
             logger.warning(f"Inbound call {call_id} not found or doesn't belong to organization {organization_id}")
             return None
@@ -412,35 +513,40 @@ async def ensure_user_organization(user_id: str) -> str:
         Organization ID
     """
     try:
-        # Get CSA organization ID first
-        supabase = get_supabase_client()
-        org_result = supabase.table("organizations").select("id").eq("name", "CSA").execute()
-        if not org_result.data:
+        # Get CSA organization ID first (TTL-cached)
+        organization_id = await get_organization_id_by_name("CSA")
+        if not organization_id:
             logger.error("CSA organization not found in database")
             return None
         
-        organization_id = org_result.data[0]["id"]
-        
-        # Try to update user metadata if service role key is available
-        if SUPABASE_SERVICE_ROLE_KEY:
+        # Try to update user metadata if service role key is available, once per user per TTL window
+        if SUPABASE_SERVICE_ROLE_KEY and user_id not in _recently_ensured_users:
+            _recently_ensured_users[user_id] = True
             try:
                 from app.database import get_supabase_admin_client
                 supabase_admin = get_supabase_admin_client()
                 
                 # Update user metadata to include organization
-                result = supabase_admin.auth.admin.update_user_by_id(user_id, {
-                    "user_metadata": {
-                        "organization_id": organization_id,
-                        "organization_name": "CSA"
-                    }
-                })
+                result = await run_supabase_async(
+                    lambda: supabase_admin.auth.admin.update_user_by_id(
+                        user_id,
+                        {
+                            "user_metadata": {
+                                "organization_id": organization_id,
+                                "organization_name": "CSA"
+                            }
+                        },
+                    )
+                )
                 
                 if result:
                     logger.info(f"Updated user {user_id} metadata with CSA organization")
                 else:
+                    _recently_ensured_users.pop(user_id, None)
                     logger.warning(f"Failed to update user {user_id} metadata")
                     
             except Exception as admin_error:
+                _recently_ensured_users.pop(user_id, None)
                 logger.warning(f"Admin update failed for user {user_id}: {str(admin_error)}")
                 # Continue without admin update
         
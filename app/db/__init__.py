@@ -0,0 +1 @@
+"""Direct Postgres access for hot paths that bypass PostgREST."""
@@ -0,0 +1,101 @@
+"""Shared asyncpg connection pool.
+
+Used for simple, high-frequency row operations (e.g. ``scrape_tasks`` polling)
+where going through the Supabase REST gateway adds a full HTTP round-trip.
+Auth and RLS-dependent operations should keep using the Supabase client.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import asyncpg
+
+from app.config.settings import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[asyncpg.Pool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_lock: Optional[asyncio.Lock] = None
+# Set while a task_pg_pool block runs without a pool, so get_pg_pool fails fast
+# instead of opening a full-size pool inside a Celery task
+_pool_unavailable = False
+
+
+async def _create_pool(min_size: int, max_size: int) -> asyncpg.Pool:
+    if not DATABASE_URL:
+        raise RuntimeError("AI_RECEPTION_DATABASE_URL is not configured")
+    # statement_cache_size=0 keeps us compatible with Supavisor / pgbouncer
+    # in transaction mode, which can't share prepared statements.
+    return await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=min_size,
+        max_size=max_size,
+        max_inactive_connection_lifetime=300,
+        statement_cache_size=0,
+    )
+
+
+async def get_pg_pool() -> asyncpg.Pool:
+    """Return the pool for the running event loop, creating it on first use.
+
+    The API process has a single loop, so this is effectively a singleton.
+    Celery tasks should wrap their ``asyncio.run`` body in :func:`task_pg_pool`
+    so the pool is closed before that loop ends. A pool still bound to another
+    loop is dropped, never terminated: its transports belong to that loop and
+    can't be touched once it is closed.
+    """
+    global _pool, _pool_loop, _pool_lock
+    loop = asyncio.get_running_loop()
+    if _pool is not None and _pool_loop is loop:
+        return _pool
+    if _pool_unavailable and _pool_loop is loop:
+        raise RuntimeError("Postgres pool is unavailable in this task")
+    if _pool_loop is not loop:
+        if _pool is not None:
+            logger.warning("Dropping Postgres pool bound to a previous event loop")
+            _pool = None
+        _pool_loop = loop
+        _pool_lock = asyncio.Lock()
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await _create_pool(min_size=10, max_size=50)
+            logger.info("Postgres connection pool created")
+    return _pool
+
+
+@asynccontextmanager
+async def task_pg_pool() -> AsyncIterator[Optional[asyncpg.Pool]]:
+    """Small pool scoped to one ``asyncio.run`` in a Celery worker.
+
+    ``get_pg_pool`` returns it while the block runs; it is closed on exit,
+    inside the same loop that opened it. If the pool can't be opened the
+    block still runs with ``None`` and ``get_pg_pool`` raises, so callers
+    take their Supabase fallback instead of failing the task.
+    """
+    global _pool, _pool_loop, _pool_lock, _pool_unavailable
+    try:
+        pool = await _create_pool(min_size=1, max_size=2)
+    except Exception as e:
+        logger.warning("Postgres pool unavailable for this task: %s", e)
+        pool = None
+    _pool, _pool_loop, _pool_lock = pool, asyncio.get_running_loop(), asyncio.Lock()
+    _pool_unavailable = pool is None
+    try:
+        yield pool
+    finally:
+        _pool = _pool_loop = _pool_lock = None
+        _pool_unavailable = False
+        if pool is not None:
+            await pool.close()
+
+
+async def close_pg_pool() -> None:
+    """Close the pool (called on app shutdown)."""
+    global _pool, _pool_loop
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        _pool_loop = None
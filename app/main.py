@@ -1,114 +1,188 @@
-from fastapi import FastAPI, Request, WebSocket
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
 import time
 import logging
-from app.config.settings import LOG_LEVEL, title, description, version, API_V1_STR, DEBUG, HOST, PORT, SUPABASE_URL, SUPABASE_KEY, SUPABASE_SERVICE_ROLE_KEY, SUPABASE_JWT_SECRET, VAPI_WEBHOOK_SECRET, VAPI_AUTH_TOKEN
+import orjson
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from app.config.settings import LOG_LEVEL, title, description, version, API_V1_STR, DEBUG, HOST, PORT, BACKEND_CORS_ORIGINS, DATABASE_URL
 from app.api.v1.router import api_router
-
-# Configure logging
+from app.utils.cache import init_cache
+from app.database import get_supabase_client, close_supabase_client
+from app.database_async import close_postgrest_client
+from app.db.pool import get_pg_pool, close_pg_pool
+from app.api.v1.receptionist import close_vapi_client
+from app.api.v1.progress import close_pubsub_redis
+from app.utils.redis_client import close_redis_client
+from app.services.auth_service import close_auth_http_client
+
+# Configure logging. Records are queued and written to stderr by a listener
+# thread, so request handlers never block on log I/O.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
-app = FastAPI(
-    title=title,
-    description=description,
-    version=version,
-    openapi_url=f"{API_V1_STR}/openapi.json",
-    docs_url=f"{API_V1_STR}/docs",
-    redoc_url=f"{API_V1_STR}/redoc",
-    debug=DEBUG,
-    redirect_slashes=False
-)
 
-# Allow frontend origins
-origins = [
-    "http://localhost:8080",
-    "http://localhost:8081",
-    "http://127.0.0.1:8080",
-    "http://localhost:3000",  # React default port
-    "http://127.0.0.1:3000",
-    "http://localhost:5173",  # Vite default port
-    "http://127.0.0.1:5173",
-    "https://myaireceptionist.indrasol.com"
-]
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,  # Allows specific origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allows all HTTP methods (GET, POST, etc.)
-    allow_headers=["*"],  # Allows all headers
-)
+# Reference to the background warm-up task so it isn't garbage collected mid-run
+_warm_up_task = None
 
 
-# Add trusted host middleware
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=["*"]  # Configure this properly for production
-)
+def _build_openapi_schema():
+    """Generate and cache the OpenAPI document (JSON schemas for every model)"""
+    return create_app().openapi()
+
+
+async def _warm_up_connections():
+    """Open the Postgres pool, build the Supabase client and generate the
+    OpenAPI schema ahead of the first request. Runs in the background so the
+    listener binds immediately."""
+    results = await asyncio.gather(
+        get_pg_pool(),
+        asyncio.to_thread(get_supabase_client),
+        asyncio.to_thread(_build_openapi_schema),
+        return_exceptions=True,
+    )
+    for name, result in zip(("Postgres pool", "Supabase client", "OpenAPI schema"), results):
+        if isinstance(result, Exception):
+            logger.warning("%s warm-up failed (will retry on first use): %s", name, result)
 
 
-# @app.middleware("http")
-# async def add_process_time_header(request: Request, call_next):
-#     """Add process time header to responses"""
-#     start_time = time.time()
-#     response = await call_next(request)
-#     process_time = time.time() - start_time
-#     response.headers["X-Process-Time"] = str(process_time)
-#     return response
+class FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with a hashed origin lookup instead of a list scan"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._origin_set = frozenset(self.allow_origins)
 
-# @app.middleware("http")
-# async def log_requests(request: Request, call_next):
-#     """Log all requests"""
-#     logger.info(f"{request.method} {request.url}")
-#     response = await call_next(request)
-#     logger.info(f"{request.method} {request.url} - {response.status_code}")
-#     return response
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins:
+            return True
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+        return origin in self._origin_set
+
+
+async def startup_event():
+    """Initialise shared resources"""
+    global _warm_up_task
+    # Scrape tasks, chunk file IDs and phone unlinking go through the asyncpg
+    # pool; refuse to start rather than serve 500s on those endpoints
+    if not DATABASE_URL:
+        raise RuntimeError("AI_RECEPTION_DATABASE_URL is not configured")
+    init_cache()
+    _warm_up_task = asyncio.create_task(_warm_up_connections())
+
+
+async def shutdown_event():
+    """Release shared resources"""
+    close_supabase_client()
+    await close_postgrest_client()
+    await close_pg_pool()
+    await close_vapi_client()
+    await close_auth_http_client()
+    await close_pubsub_redis()
+    await close_redis_client()
+    _log_listener.stop()
 
 
-@app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
-    logger.error(f"Global exception: {exc}")
+    logger.error("Global exception: %s", exc, exc_info=exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
 
 
-@app.get("/")
+# Root payload never changes, so it is serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "AI Receptionist API",
+    "version": version,
+    "docs": f"{API_V1_STR}/docs"
+})
+
+
 async def root():
     """Root endpoint"""
-    return {
-        "message": "AI Receptionist API",
-        "version": version,
-        "docs": f"{API_V1_STR}/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": time.time()}
+    return Response(
+        content=orjson.dumps({"status": "healthy", "timestamp": time.time()}),
+        media_type="application/json",
+    )
+
+
+@lru_cache(maxsize=1)
+def create_app() -> FastAPI:
+    """Build the configured FastAPI application (once per process)"""
+    app = FastAPI(
+        title=title,
+        description=description,
+        version=version,
+        openapi_url=f"{API_V1_STR}/openapi.json",
+        docs_url=f"{API_V1_STR}/docs",
+        redoc_url=f"{API_V1_STR}/redoc",
+        debug=DEBUG,
+        redirect_slashes=False,
+        default_response_class=ORJSONResponse
+    )
 
+    # Allow frontend origins
+    app.add_middleware(
+        FastCORSMiddleware,
+        allow_origins=BACKEND_CORS_ORIGINS,  # Allows specific origins
+        allow_credentials=True,
+        allow_methods=["*"],  # Allows all HTTP methods (GET, POST, etc.)
+        allow_headers=["*"],  # Allows all headers
+    )
+
+    # Add trusted host middleware
+    app.add_middleware(
+        TrustedHostMiddleware,
+        allowed_hosts=["*"]  # Configure this properly for production
+    )
 
-# Include API router
-app.include_router(api_router, prefix=API_V1_STR)
+    app.add_event_handler("startup", startup_event)
+    app.add_event_handler("shutdown", shutdown_event)
+    app.add_exception_handler(Exception, global_exception_handler)
+
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+
+    # Include API router
+    app.include_router(api_router, prefix=API_V1_STR)
+    return app
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
+    # Dev: single reloading process on the default asyncio loop.
+    # Otherwise: uvloop + httptools with one worker per CPU.
     uvicorn.run(
         "app.main:app",
         host=HOST,
         port=PORT,
-        reload=DEBUG
-    ) 
+        reload=DEBUG,
+        loop="asyncio" if DEBUG else "uvloop",
+        http="auto" if DEBUG else "httptools",
+        workers=None if DEBUG else (os.cpu_count() or 1),
+    )
+
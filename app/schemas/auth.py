@@ -1,6 +1,10 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 
+# Response models are built once and only serialized; freezing them skips
+# assignment validation and guards them against accidental mutation
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
 class UserSignupRequest(BaseModel):
     """Request model for user signup"""
     email: EmailStr = Field(..., description="User's email address")
@@ -16,6 +20,8 @@ class UserSigninRequest(BaseModel):
 
 class UserResponse(BaseModel):
     """Response model for user data"""
+    model_config = _RESPONSE_CONFIG
+
     id: str
     email: str
     username: str
@@ -26,6 +32,8 @@ class UserResponse(BaseModel):
 
 class AuthResponse(BaseModel):
     """Response model for authentication"""
+    model_config = _RESPONSE_CONFIG
+
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -34,16 +42,22 @@ class AuthResponse(BaseModel):
 
 class SignupResponse(BaseModel):
     """Response model for signup"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     user: UserResponse
 
 class SigninResponse(BaseModel):
     """Response model for signin"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     auth: AuthResponse
 
 class LogoutResponse(BaseModel):
     """Response model for logout"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
 
 class TokenVerifyRequest(BaseModel):
@@ -52,6 +66,8 @@ class TokenVerifyRequest(BaseModel):
 
 class TokenVerifyResponse(BaseModel):
     """Response model for token verification"""
+    model_config = _RESPONSE_CONFIG
+
     valid: bool
     claims: Optional[dict] = None
     message: Optional[str] = None
@@ -62,6 +78,8 @@ class PasswordResetRequest(BaseModel):
 
 class PasswordResetResponse(BaseModel):
     """Response model for password reset"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
 
 
@@ -79,11 +97,13 @@ class OtpRequest(BaseModel):
 class OtpVerifyRequest(BaseModel):
     """Payload for verifying an OTP code sent to email"""
     email: EmailStr
-    otp: str = Field(..., min_length=6, max_length=6, description="6-digit numeric code")
+    otp: str = Field(..., pattern=r"^\d{6}$", description="6-digit numeric code")
 
 
 class GenericMessage(BaseModel):
     """Simple message-only response"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
 
 
@@ -92,6 +112,8 @@ class GenericMessage(BaseModel):
 
 class TokenResponse(BaseModel):
     """JWT token response after successful OTP verification"""
+    model_config = _RESPONSE_CONFIG
+
     access_token: str
     token_type: str = "bearer"
     expires_in: int
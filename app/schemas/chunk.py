@@ -2,14 +2,31 @@
 Pydantic schemas for chunks table
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+import re
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, Optional, List, Literal
 from datetime import datetime
 from uuid import UUID
 
 # Source type enum
 SourceType = Literal["website", "file", "text"]
 
+# Response DTOs are serialized once and never mutated
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+
+def _check_uuid(value: str) -> str:
+    if not _UUID_RE.match(value):
+        raise ValueError("Input should be a valid UUID")
+    return value
+
+
+# UUID checked on client input but kept as str; rows read back from the
+# database carry plain str ids and are not re-parsed into uuid.UUID
+UuidStr = Annotated[str, AfterValidator(_check_uuid)]
+
 class ChunkBase(BaseModel):
     """Base chunk schema with common fields"""
     source_type: SourceType = Field(..., description="Type of source: website, file, or text")
@@ -22,8 +39,8 @@ class ChunkBase(BaseModel):
 
 class ChunkCreate(ChunkBase):
     """Schema for creating a new chunk"""
-    organization_id: UUID = Field(..., description="Organization that owns this chunk")
-    receptionist_id: Optional[UUID] = Field(None, description="Receptionist this chunk is linked to")
+    organization_id: UuidStr = Field(..., description="Organization that owns this chunk")
+    receptionist_id: Optional[UuidStr] = Field(None, description="Receptionist this chunk is linked to")
 
 class ChunkUpdate(BaseModel):
     """Schema for updating a chunk"""
@@ -32,28 +49,29 @@ class ChunkUpdate(BaseModel):
     content: Optional[str] = Field(None, description="The actual cleaned text content of the chunk")
     bullets: Optional[List[str]] = Field(None, description="Array of key bullet points extracted from content")
     sample_questions: Optional[List[str]] = Field(None, description="Array of sample questions this chunk can answer")
-    receptionist_id: Optional[UUID] = Field(None, description="Receptionist this chunk is linked to")
+    receptionist_id: Optional[UuidStr] = Field(None, description="Receptionist this chunk is linked to")
 
 class ChunkDB(ChunkBase):
     """Schema for chunk as stored in database"""
-    id: UUID = Field(..., description="Unique identifier for the chunk")
-    organization_id: UUID = Field(..., description="Organization that owns this chunk")
+    id: str = Field(..., description="Unique identifier for the chunk")
+    organization_id: str = Field(..., description="Organization that owns this chunk")
     created_at: datetime = Field(..., description="Timestamp when chunk was created")
     updated_at: datetime = Field(..., description="Timestamp when chunk was last updated")
-    created_by_user_id: Optional[UUID] = Field(None, description="User who created this chunk")
-    receptionist_id: Optional[UUID] = Field(None, description="Receptionist this chunk is linked to")
+    created_by_user_id: Optional[str] = Field(None, description="User who created this chunk")
+    receptionist_id: Optional[str] = Field(None, description="Receptionist this chunk is linked to")
     vapi_file_id: Optional[str] = Field(None, description="VAPI file ID if uploaded to VAPI knowledge base")
     deleted: bool = Field(False, description="Soft delete flag")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ChunkResponse(ChunkDB):
     """Schema for chunk API response"""
-    pass
+    model_config = _RESPONSE_CONFIG
 
 class ChunkListResponse(BaseModel):
     """Schema for chunk list API response"""
+    model_config = _RESPONSE_CONFIG
+
     chunks: List[ChunkResponse]
     total: int
     page: int
@@ -66,6 +84,9 @@ class ChunkBulkCreate(BaseModel):
     source_type: SourceType = Field(..., description="Type of source for all chunks")
     source_id: str = Field(..., max_length=500, description="Source identifier for all chunks")
 
+# Built once; dumps a whole validated chunk list to insert-ready dicts in a single call
+CHUNK_CREATE_LIST_ADAPTER = TypeAdapter(List[ChunkCreate])
+
 class ChunkSearchRequest(BaseModel):
     """Schema for searching chunks"""
     query: str = Field(..., min_length=1, description="Search query")
@@ -75,6 +96,8 @@ class ChunkSearchRequest(BaseModel):
 
 class ChunkSearchResponse(BaseModel):
     """Schema for chunk search response"""
+    model_config = _RESPONSE_CONFIG
+
     chunks: List[ChunkResponse]
     total: int
     page: int
@@ -1,11 +1,25 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+import re
+from pydantic import AfterValidator, BaseModel
+from typing import Annotated, Optional
+
+# Shape check only: the contact form is relayed by email, so full RFC parsing
+# (and email-validator's idna handling) buys nothing here
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(value: str) -> str:
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+ContactEmail = Annotated[str, AfterValidator(_check_email)]
 
 
 class ContactForm(BaseModel):
     """Contact form schema"""
     name: str
-    email: EmailStr
+    email: ContactEmail
     company: Optional[str] = None
     subject: Optional[str] = None
     message: Optional[str] = None
@@ -13,4 +27,4 @@ class ContactForm(BaseModel):
 
 class ContactResponse(BaseModel):
     """Contact response schema"""
-    detail: str 
\ No newline at end of file
+    detail: str
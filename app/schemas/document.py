@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List
 from datetime import datetime
 
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
 class TextInputRequest(BaseModel):
     text: str
     name: str = "Text Content"
@@ -12,16 +14,6 @@ class DocumentProcessRequest(BaseModel):
     """Request schema for document processing"""
     pass  # File will be uploaded via multipart form
 
-class DocumentProcessResponse(BaseModel):
-    """Response schema for document processing"""
-    message: str
-    filename: str
-    file_type: str
-    file_size: int
-    content_length: int
-    chunks_generated: int
-    chunks: List[Dict[str, Any]]
-
 class DocumentInfo(BaseModel):
     """Document information schema"""
     filename: str
@@ -45,8 +37,20 @@ class DocumentChunkResponse(BaseModel):
     updated_at: Optional[datetime] = None
     created_by_user_id: Optional[str] = None
 
+class DocumentProcessResponse(BaseModel):
+    """Response schema for document processing"""
+    message: str
+    filename: str
+    file_type: str
+    file_size: int
+    content_length: int
+    chunks_generated: int
+    chunks: List[DocumentChunkResponse]
+
 class DocumentUploadResponse(BaseModel):
     """Response schema for document upload and processing"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     document_info: DocumentInfo
     chunks_generated: int
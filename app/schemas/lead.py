@@ -1,14 +1,50 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional, List, Any, Union
+import re
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+from typing import Annotated, Optional, List, Union
 from datetime import datetime
 
+__all__ = [
+    "Lead",
+    "LeadResponse",
+    "LeadList",
+    "LeadDB",
+    "SheetLeadRecord",
+    "GoogleSheetsResponse",
+    "LeadIdRequest",
+    "CallLeadsRequest",
+    "CallLeadResponse",
+    "CallLeadsResponse",
+    "VapiVoicesResponse",
+    "VapiPhoneNumbersResponse",
+    "VapiVoiceIdResponse",
+    "VapiBackendVoiceResponse",
+    "PhoneStr",
+    "normalize_phone_number",
+]
+
+# Anything that isn't a digit or "+" (spaces, dashes, dots, parentheses)
+_PHONE_STRIP_RE = re.compile(r"[^\d+]")
+
+
+def normalize_phone_number(value):
+    """Strip formatting from a phone number and make sure it carries a + prefix"""
+    if not isinstance(value, str) or not value:
+        return value
+    cleaned = _PHONE_STRIP_RE.sub("", value)
+    return cleaned if cleaned.startswith("+") else f"+{cleaned}"
+
+
+PhoneStr = Annotated[str, BeforeValidator(normalize_phone_number)]
+
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
 
 class Lead(BaseModel):
     """Individual lead schema for simple Excel format"""
     id: Optional[str] = None
     first_name: str
     last_name: str
-    phone_number: str
+    phone_number: PhoneStr
     created_at: Optional[Union[str, datetime]] = None
 
 
@@ -32,7 +68,7 @@ class LeadDB(BaseModel):
     id: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    phone_number: Optional[str] = None
+    phone_number: Optional[PhoneStr] = None
     
     # Source and import information
     source: Optional[str] = None
@@ -60,12 +96,34 @@ class LeadDB(BaseModel):
     updated_at: Optional[Union[str, datetime]] = None
 
 
+class SheetLeadRecord(BaseModel):
+    """Inserted lead echoed back by the upload endpoints, keyed like the sheet columns"""
+    FirstName: Optional[str] = None
+    LastName: Optional[str] = None
+    PhoneNumber: Optional[str] = None
+    id: Optional[Union[str, int]] = None
+    source: Optional[str] = None
+    imported_at: Optional[str] = None
+    created_at: Optional[str] = None
+    created_by_user_id: Optional[str] = None
+    created_by_user_email: Optional[str] = None
+    vapi_call_id: Optional[str] = None
+    call_status: Optional[str] = None
+    call_summary: Optional[str] = None
+    call_recording_url: Optional[str] = None
+    call_transcript: Optional[str] = None
+    success_evaluation: Optional[str] = None
+    # Only one of these is present, depending on the upload source
+    sheet_url: Optional[str] = None
+    filename: Optional[str] = None
+
+
 class GoogleSheetsResponse(BaseModel):
     """Response schema for Google Sheets operations"""
     message: str
     rows_count: int
     columns: List[str]
-    data: List[dict]  # The actual sheet data with embedded database IDs
+    data: List[SheetLeadRecord]  # The actual sheet data with embedded database IDs
 
 
 class LeadIdRequest(BaseModel):
@@ -84,7 +142,7 @@ class CallLeadResponse(BaseModel):
     message: str
     lead_id: str
     customer_name: str
-    phone_number: str
+    phone_number: PhoneStr
     vapi_response: dict
 
 
@@ -100,6 +158,8 @@ class CallLeadsResponse(BaseModel):
 
 class VapiVoicesResponse(BaseModel):
     """Response schema for VAPI voice agents list"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     assistants: List[dict]  # List of VAPI voice agents
     total_count: int
@@ -107,6 +167,8 @@ class VapiVoicesResponse(BaseModel):
 
 class VapiPhoneNumbersResponse(BaseModel):
     """Response schema for VAPI available phone numbers list"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     phone_numbers: List[dict]  # List of available phone numbers
     total_count: int
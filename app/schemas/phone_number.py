@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
-from decimal import Decimal
+
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 class PhoneNumberBase(BaseModel):
     """Base schema for phone number data"""
@@ -15,7 +16,7 @@ class PhoneNumberBase(BaseModel):
     status: str = Field(default="active", description="Status: active, inactive, suspended, pending")
     description: Optional[str] = Field(None, description="Human-readable description")
     is_default: bool = Field(default=False, description="Whether this is the default phone number")
-    monthly_cost: Decimal = Field(default=0.00, description="Monthly cost for this phone number")
+    monthly_cost: float = Field(default=0.0, ge=0, description="Monthly cost for this phone number")
 
 class PhoneNumberCreate(PhoneNumberBase):
     """Schema for creating a new phone number"""
@@ -32,7 +33,7 @@ class PhoneNumberUpdate(BaseModel):
     status: Optional[str] = None
     description: Optional[str] = None
     is_default: Optional[bool] = None
-    monthly_cost: Optional[Decimal] = None
+    monthly_cost: Optional[float] = Field(None, ge=0)
 
 class PhoneNumberDB(PhoneNumberBase):
     """Schema for phone number data from database"""
@@ -44,15 +45,16 @@ class PhoneNumberDB(PhoneNumberBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
     created_by_user_id: Optional[str] = Field(None, description="User who created this record")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PhoneNumberResponse(PhoneNumberDB):
     """Schema for phone number API responses"""
-    pass
+    model_config = _RESPONSE_CONFIG
 
 class PhoneNumberListResponse(BaseModel):
     """Schema for phone number list responses"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     phone_numbers: List[PhoneNumberResponse]
     total_count: int
@@ -87,7 +89,7 @@ class PhoneNumberStats(BaseModel):
     by_country: dict
     by_provider: dict
     by_type: dict
-    total_monthly_cost: Decimal
+    total_monthly_cost: float
     most_used_number: Optional[PhoneNumberResponse] = None
 
 class PhoneNumberStatsResponse(BaseModel):
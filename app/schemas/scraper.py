@@ -1,7 +1,9 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
 
 class UrlScrapeRequest(BaseModel):
     """Request schema for URL scraping"""
@@ -14,6 +16,8 @@ class UrlScrapeRequest(BaseModel):
 
 class ScrapedContent(BaseModel):
     """Schema for individual scraped content"""
+    model_config = _RESPONSE_CONFIG
+
     url: str
     title: Optional[str] = None
     content: Optional[str] = None
@@ -29,6 +33,8 @@ class ScrapedContent(BaseModel):
 
 class UrlScrapeResponse(BaseModel):
     """Response schema for URL scraping"""
+    model_config = _RESPONSE_CONFIG
+
     message: str
     total_urls_scraped: int
     successful_scrapes: int
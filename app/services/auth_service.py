@@ -1,15 +1,89 @@
+import asyncio
+import hashlib
 import os
-import requests
+import time
+import httpx
 import jwt
-from datetime import datetime, timedelta
+import orjson
+from cachetools import TTLCache
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from fastapi import HTTPException
 from app.config.settings import SUPABASE_JWT_SECRET
+from app.database_async import postgrest_rpc, postgrest_select
+from app.database_operations import get_organization_id_by_name
 from app.schemas.auth import UserSignupRequest, UserSigninRequest, UserResponse, AuthResponse
 import logging
 
 logger = logging.getLogger(__name__)
 
+AUTH_HTTP_TIMEOUT_SECONDS = 10
+AUTH_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# jwt.decode arguments, built once rather than per verification
+JWT_ALGORITHMS = ("HS256",)
+JWT_AUDIENCE = "authenticated"
+JWT_LEEWAY_SECONDS = 10
+JWT_DECODE_OPTIONS = {"verify_iat": False}  # ignore minimal clock skew issues
+
+# Recently verified tokens: blake2b(token) -> (claims, exp). The same bearer
+# token arrives on every request of a session, so HMAC + claim parsing runs
+# once per minute per token instead of per request. Expiry is still checked
+# on each hit.
+_verified_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Users found by the finders, keyed ("username", name) / ("email", address).
+# Only hits are cached, so a freshly registered name or email is never hidden
+# by a stale miss during signup.
+_user_lookup_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _remember_user(user: Dict[str, Any]) -> None:
+    """Cache a found user under both its username and email"""
+    username = (user.get("user_metadata") or {}).get("username")
+    if username:
+        _user_lookup_cache[("username", username)] = user
+    if user.get("email"):
+        _user_lookup_cache[("email", user["email"])] = user
+
+
+# Process-wide GoTrue client, created lazily on first use. AuthService is
+# instantiated per request, so the pool can't live on the instance.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client(auth_url: str, api_key: str) -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=auth_url,
+            headers={"apikey": api_key},
+            timeout=AUTH_HTTP_TIMEOUT_SECONDS,
+            limits=AUTH_HTTP_LIMITS,
+            http2=True,
+        )
+    return _http_client
+
+
+async def close_auth_http_client() -> None:
+    """Close the shared Supabase Auth connection pool (called on app shutdown)."""
+    global _http_client
+    if _http_client is None:
+        return
+    try:
+        await _http_client.aclose()
+    except Exception as e:
+        logger.warning("Failed to close Supabase Auth client: %s", e)
+    _http_client = None
+
+
+def _now_iso() -> str:
+    """Fallback timestamp for user payloads that lack one"""
+    return datetime.now(timezone.utc).isoformat()
+
+
 class AuthService:
     """Service class for handling authentication operations"""
     
@@ -28,28 +102,40 @@ class AuthService:
                 "AI_RECEPTION_SUPABASE_JWT_SECRET"
             )
         
-        # Supabase client for OTP table operations
-        from app.database_operations import get_supabase_client  # local import to avoid circular
-        self._supabase = get_supabase_client()
+        # Pooled keep-alive client; carries the service-role apikey by default
+        self._http = _get_http_client(self.auth_url, self.supabase_key)
+        # Admin endpoints additionally need the service role as bearer token
+        self._admin_headers = {"Authorization": f"Bearer {self.supabase_key}"}
+        # OTP send/verify go through the public (anon) key instead
+        self._anon_headers = {"apikey": self.supabase_anon_key}
     
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get headers for Supabase auth API calls"""
-        return {
-            "apikey": self.supabase_key,
-            "Authorization": f"Bearer {self.supabase_key}",
-            "Content-Type": "application/json"
-        }
+    async def _post_json(
+        self,
+        path: str,
+        *,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """POST an orjson-encoded body to the Supabase Auth API"""
+        return await self._http.post(
+            path,
+            content=orjson.dumps(payload),
+            headers={**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS,
+            params=params,
+        )
     
     async def signup_user(self, user_data: UserSignupRequest) -> UserResponse:
         """Register a new user"""
         try:
-            # Check if username already exists
-            existing_user = await self._find_user_by_username(user_data.username)
+            # Check whether the username or email is taken (independent lookups, run together)
+            existing_user, existing_email = await asyncio.gather(
+                self._find_user_by_username(user_data.username),
+                self._find_user_by_email(user_data.email),
+            )
             if existing_user:
                 raise ValueError(f"Username '{user_data.username}' already exists")
             
-            # Check if email already exists
-            existing_email = await self._find_user_by_email(user_data.email)
             if existing_email:
                 raise ValueError(f"Email '{user_data.email}' already exists")
             
@@ -57,10 +143,10 @@ class AuthService:
             default_org_id = await self._get_default_organization_id()
             
             # Create user in Supabase
-            response = requests.post(
-                f"{self.auth_url}/admin/users",
-                headers=self._get_auth_headers(),
-                json={
+            response = await self._post_json(
+                "/admin/users",
+                headers=self._admin_headers,
+                payload={
                     "email": user_data.email,
                     "password": user_data.password,
                     "email_confirm": True,  # Auto-confirm email
@@ -74,12 +160,12 @@ class AuthService:
                 }
             )
             
-            if not response.ok:
-                error_detail = response.json() if response.content else response.text
+            if not response.is_success:
+                error_detail = orjson.loads(response.content) if response.content else response.text
                 logger.error(f"Supabase signup failed: {error_detail}")
                 raise ValueError(f"Failed to create user: {error_detail}")
             
-            user_info = response.json()
+            user_info = orjson.loads(response.content)
             
             # Return user data
             return UserResponse(
@@ -88,8 +174,8 @@ class AuthService:
                 username=user_data.username,
                 first_name=user_data.first_name,
                 last_name=user_data.last_name,
-                created_at=user_info.get("created_at", datetime.now(dt.timezone.utc).isoformat()),
-                updated_at=user_info.get("updated_at", datetime.now(dt.timezone.utc).isoformat())
+                created_at=user_info.get("created_at") or _now_iso(),
+                updated_at=user_info.get("updated_at") or _now_iso()
             )
             
         except Exception as e:
@@ -102,6 +188,7 @@ class AuthService:
             identifier = credentials.identifier
             password = credentials.password
             # Determine if identifier is email or username
+            user = None
             if "@" in identifier:
                 email = identifier
             else:
@@ -112,24 +199,24 @@ class AuthService:
                 email = user["email"]
             
             # Authenticate with Supabase
-            response = requests.post(
-                f"{self.auth_url}/token?grant_type=password",
-                headers={"apikey": self.supabase_key},
-                json={
+            response = await self._post_json(
+                "/token",
+                params={"grant_type": "password"},
+                payload={
                     "email": email,
                     "password": password
                 }
             )
             
-            if not response.ok:
-                error_detail = response.json() if response.content else response.text
+            if not response.is_success:
+                error_detail = orjson.loads(response.content) if response.content else response.text
                 logger.error(f"Supabase signin failed: {error_detail}")
                 raise ValueError("Invalid username or password")
             
-            auth_data = response.json()
-            # Get user details
-            user = await self._find_user_by_email(email)
-            print(user)
+            auth_data = orjson.loads(response.content)
+            # Get user details: GoTrue returns the user with the session, and a
+            # username sign-in already has it; only look it up as a last resort
+            user = auth_data.get("user") or user or await self._find_user_by_email(email)
             if not user:
                 raise ValueError("User not found")
             
@@ -140,8 +227,8 @@ class AuthService:
                 username=user.get("user_metadata", {}).get("username", ""),
                 first_name=user.get("user_metadata", {}).get("first_name"),
                 last_name=user.get("user_metadata", {}).get("last_name"),
-                created_at=user.get("created_at", datetime.now(dt.timezone.utc).isoformat()),
-                updated_at=user.get("updated_at", datetime.now(dt.timezone.utc).isoformat())
+                created_at=user.get("created_at") or _now_iso(),
+                updated_at=user.get("updated_at") or _now_iso()
             )
             
             # Create auth response
@@ -159,13 +246,12 @@ class AuthService:
     async def logout_user(self, refresh_token: str) -> bool:
         """Logout user by invalidating refresh token"""
         try:
-            response = requests.post(
-                f"{self.auth_url}/logout",
-                headers={"apikey": self.supabase_key},
-                json={"refresh_token": refresh_token}
+            response = await self._post_json(
+                "/logout",
+                payload={"refresh_token": refresh_token}
             )
             
-            if not response.ok:
+            if not response.is_success:
                 logger.warning(f"Logout request failed: {response.text}")
                 return False
             
@@ -177,20 +263,30 @@ class AuthService:
     
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify JWT token and return claims"""
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = _verified_tokens.get(cache_key)
+        if cached is not None:
+            claims, expires_at = cached
+            if expires_at is None or time.time() < expires_at + JWT_LEEWAY_SECONDS:
+                # Copy: callers attach request-specific keys (e.g. organization) to the claims
+                return {"valid": True, "claims": dict(claims)}
+            _verified_tokens.pop(cache_key, None)
+
         try:
-            # Add debug logging
-            logger.info(f"Attempting to verify token: {token[:20]}...")
-            logger.info(f"Using JWT secret: {self.supabase_jwt_secret[:10]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Attempting to verify token: %s...", token[:20])
             
             decoded = jwt.decode(
                 token,
                 self.supabase_jwt_secret,
-                algorithms=["HS256"],
-                audience="authenticated",
-                leeway=10,
-                options={"verify_iat": False},  # ignore minimal clock skew issues
+                algorithms=JWT_ALGORITHMS,
+                audience=JWT_AUDIENCE,
+                leeway=JWT_LEEWAY_SECONDS,
+                options=JWT_DECODE_OPTIONS,
             )
-            logger.info(f"Token verified successfully, claims: {decoded}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Token verified successfully, claims: %s", decoded)
+            _verified_tokens[cache_key] = (dict(decoded), decoded.get("exp"))
             return {"valid": True, "claims": decoded}
         except jwt.ExpiredSignatureError:
             logger.warning("Token expired")
@@ -205,13 +301,12 @@ class AuthService:
     async def reset_password(self, email: str) -> bool:
         """Send password reset email"""
         try:
-            response = requests.post(
-                f"{self.auth_url}/recover",
-                headers={"apikey": self.supabase_key},
-                json={"email": email}
+            response = await self._post_json(
+                "/recover",
+                payload={"email": email}
             )
             
-            if not response.ok:
+            if not response.is_success:
                 logger.error(f"Password reset failed: {response.text}")
                 return False
             
@@ -222,112 +317,50 @@ class AuthService:
             return False
     
     async def _find_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
-        """Find user by username"""
+        """Find user by username (matched in Postgres, see find_auth_user_by_username)
+        
+        Raises RuntimeError when the lookup itself fails (e.g. migration 14 not
+        applied, or no service-role key), so signup never mistakes an outage
+        for a free username.
+        """
+        cached = _user_lookup_cache.get(("username", username))
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(
-                f"{self.auth_url}/admin/users",
-                headers=self._get_auth_headers()
-            )
-            
-            if not response.ok:
-                logger.warning(f"Failed to fetch users: {response.status_code} - {response.text}")
-                return None
-            
-            # Parse response only once and handle potential errors
-            try:
-                users = response.json()
-            except Exception as json_error:
-                logger.error(f"Failed to parse users response as JSON: {json_error}")
-                logger.error(f"Response content: {response.text}")
-                return None
-            
-            # Handle both list and dict responses from Supabase
-            if isinstance(users, dict):
-                # If it's a dict, it might be an error response or single user
-                if "error" in users or "message" in users:
-                    logger.error(f"Supabase API error: {users}")
-                    return None
-                
-                # Check if it's the new format with 'users' key
-                if "users" in users and isinstance(users["users"], list):
-                    # Extract the actual users list
-                    actual_users = users["users"]
-                    for user in actual_users:
-                        if isinstance(user, dict) and user.get("user_metadata", {}).get("username") == username:
-                            return user
-                    return None
-                
-                # If it's a single user object, check if it matches
-                if users.get("user_metadata", {}).get("username") == username:
-                    return users
-                return None
-            elif isinstance(users, list):
-                # Normal case: list of users
-                for user in users:
-                    if isinstance(user, dict) and user.get("user_metadata", {}).get("username") == username:
-                        return user
-            else:
-                logger.error(f"Unexpected response type from Supabase: {type(users)}")
-                return None
-            
-            return None
-            
+            user = await postgrest_rpc("find_auth_user_by_username", {"p_username": username})
         except Exception as e:
             logger.error(f"Error finding user by username: {str(e)}")
+            raise RuntimeError("Username lookup failed") from e
+        if not isinstance(user, dict):
             return None
+        _remember_user(user)
+        return user
     
     async def _find_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Find user by email"""
+        cached = _user_lookup_cache.get(("email", email))
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(
-                f"{self.auth_url}/admin/users",
-                headers=self._get_auth_headers()
+            # GoTrue narrows the list server-side (substring match on email);
+            # the exact comparison below picks the one user
+            response = await self._http.get(
+                "/admin/users",
+                params={"filter": email},
+                headers=self._admin_headers
             )
             
-            if not response.ok:
+            if not response.is_success:
                 logger.warning(f"Failed to fetch users: {response.status_code} - {response.text}")
                 return None
             
-            # Parse response only once and handle potential errors
-            try:
-                users = response.json()
-            except Exception as json_error:
-                logger.error(f"Failed to parse users response as JSON: {json_error}")
-                logger.error(f"Response content: {response.text}")
-                return None
-            print(isinstance(users, list))
-            print(users)
-            print(isinstance(users, dict))
-            print(users)
-            # Handle both list and dict responses from Supabase
-            if isinstance(users, dict):
-                # If it's a dict, it might be an error response or single user
-                if "error" in users or "message" in users:
-                    logger.error(f"Supabase API error: {users}")
-                    return None
-                
-                # Check if it's the new format with 'users' key
-                if "users" in users and isinstance(users["users"], list):
-                    # Extract the actual users list
-                    actual_users = users["users"]
-                    for user in actual_users:
-                        if isinstance(user, dict) and user.get("email") == email:
-                            return user
-                    return None
-                
-                # If it's a single user object, check if it matches
-                if users.get("email") == email:
-                    return users
-                return None
-            elif isinstance(users, list):
-                # Normal case: list of users
-                for user in users:
-                    if isinstance(user, dict) and user.get("email") == email:
-                        return user
-            else:
-                logger.error(f"Unexpected response type from Supabase: {type(users)}")
-                return None
-            
+            payload = orjson.loads(response.content)
+            # Newer GoTrue wraps the list as {"users": [...]}, older versions return it bare
+            users = payload.get("users", []) if isinstance(payload, dict) else payload
+            for user in users:
+                if isinstance(user, dict) and user.get("email") == email:
+                    _remember_user(user)
+                    return user
             return None
             
         except Exception as e:
@@ -354,9 +387,7 @@ class AuthService:
                 detail="Authorization header is required"
             )
         
-        token = authorization[:]
-        if authorization.startswith("Bearer "):
-            token = authorization[7:]
+        token = authorization.removeprefix("Bearer ")
         
         if not token:
             raise HTTPException(
@@ -397,8 +428,12 @@ class AuthService:
         org_exists = False
         if is_signup and norm_meta.get("organization_name"):
             try:
-                org_check = self._supabase.table("organizations").select("id").ilike("name", norm_meta["organization_name"]).execute()
-                org_exists = bool(org_check.data)
+                org_check = await postgrest_select("organizations", {
+                    "select": "id",
+                    "name": f"ilike.{norm_meta['organization_name']}",
+                    "limit": "1",
+                })
+                org_exists = bool(org_check)
             except Exception:
                 org_exists = False
 
@@ -424,16 +459,13 @@ class AuthService:
                     "signup_flow": True  # Flag for trigger
                 }
             
-            logger.info(f"Sending OTP to {email} with data: {signup_data}")
+            logger.debug("Sending OTP to %s with data: %s", email, signup_data)
             
             # Send OTP with metadata - Supabase will store it
-            otp_response = requests.post(
-                f"{self.auth_url}/otp",
-                headers={
-                    "apikey": self.supabase_anon_key,
-                    "Content-Type": "application/json"
-                },
-                json={
+            otp_response = await self._post_json(
+                "/otp",
+                headers=self._anon_headers,
+                payload={
                     "email": email,
                     "data": signup_data,  # This stores metadata
                     "options": {
@@ -442,10 +474,11 @@ class AuthService:
                 }
             )
             
-            logger.info(f"Supabase OTP response: {otp_response.status_code} - {otp_response.text[:200]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Supabase OTP response: %s - %s", otp_response.status_code, otp_response.text[:200])
             
-            if not otp_response.ok:
-                error_detail = otp_response.json() if otp_response.content else otp_response.text
+            if not otp_response.is_success:
+                error_detail = orjson.loads(otp_response.content) if otp_response.content else otp_response.text
                 logger.error(f"Supabase OTP failed: {error_detail}")
                 raise ValueError(f"Failed to send OTP: {error_detail}")
                 
@@ -467,26 +500,24 @@ class AuthService:
         try:
             # Use Supabase Auth API to verify OTP
             # This endpoint updates confirmed_at when OTP is correct
-            response = requests.post(
-                f"{self.auth_url}/verify",
-                headers={
-                    "apikey": self.supabase_anon_key,  # Use anon key for verification too
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = await self._post_json(
+                "/verify",
+                headers=self._anon_headers,  # Use anon key for verification too
+                payload={
                     "email": email,
                     "token": code,
                     "type": "email"
                 }
             )
             
-            # Debug logging
-            logger.info(f"Supabase OTP verify response status: {response.status_code}")
-            logger.info(f"Supabase OTP verify response content: {response.text[:500]}")  # First 500 chars
+            # Debug logging (the body carries session tokens, so never at info)
+            logger.debug("Supabase OTP verify response status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Supabase OTP verify response content: %s", response.text[:500])  # First 500 chars
             
-            if not response.ok:
+            if not response.is_success:
                 try:
-                    error_detail = response.json() if response.content else response.text
+                    error_detail = orjson.loads(response.content) if response.content else response.text
                 except:
                     error_detail = response.text
                 logger.error(f"Supabase OTP verification failed: {error_detail}")
@@ -494,7 +525,7 @@ class AuthService:
             
             # Try to parse JSON response
             try:
-                auth_data = response.json()
+                auth_data = orjson.loads(response.content)
                 logger.info(f"OTP verified successfully for {email}")
             except Exception as json_error:
                 logger.error(f"Failed to parse Supabase response as JSON: {json_error}")
@@ -528,8 +559,10 @@ class AuthService:
         import datetime as dt
         try:
             # Get user profile for token generation
-            prof_res = self._supabase.table("profiles").select("*").eq("email", email).single().execute()
-            profile = prof_res.data if prof_res.data else {}
+            profiles = await postgrest_select("profiles", {"select": "*", "email": f"eq.{email}"})
+            if len(profiles) != 1:
+                raise ValueError(f"Expected one profile for {email}, found {len(profiles)}")
+            profile = profiles[0]
             
             # Generate JWT token
             token_payload = {
@@ -564,17 +597,14 @@ class AuthService:
     async def _get_default_organization_id(self) -> str:
         """Get the default organization ID (CSA)"""
         try:
-            # Import here to avoid circular imports
-            from app.database_operations import get_supabase_client
-            
-            supabase = get_supabase_client()
-            org_result = supabase.table("organizations").select("id").eq("name", "CSA").execute()
+            # Served from the organization-by-name TTL cache after the first call
+            org_id = await get_organization_id_by_name("CSA")
             
-            if not org_result.data:
+            if not org_id:
                 logger.error("CSA organization not found in database")
                 raise ValueError("Default organization not found")
             
-            return org_result.data[0]["id"]
+            return org_id
             
         except Exception as e:
             logger.error(f"Failed to get default organization ID: {str(e)}")
@@ -4,8 +4,10 @@ OpenAI Service for content processing and chunk generation
 
 import logging
 import openai
+import orjson
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from app.config.settings import CSA_OPENAIIND
+from app.config.settings import CSA_OPENAIIND, MAX_TOTAL_CHUNKS_CHARACTERS, MAX_CHUNK_CHARACTERS
 
 logger = logging.getLogger(__name__)
 
@@ -161,12 +163,10 @@ IMPORTANT: You must respond with ONLY a valid JSON object. Do not include any te
     ) -> List[Dict[str, Any]]:
         """Parse OpenAI response into chunk format"""
         try:
-            import json
-            
             logger.info(f"Raw OpenAI response: {response[:200]}...")
             
             # Parse the JSON response
-            parsed_response = json.loads(response)
+            parsed_response = orjson.loads(response)
             
             # Handle different response formats
             if isinstance(parsed_response, dict):
@@ -204,7 +204,7 @@ IMPORTANT: You must respond with ONLY a valid JSON object. Do not include any te
             logger.info(f"Successfully parsed {len(chunks)} chunks from OpenAI response")
             return chunks
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse OpenAI response as JSON: {str(e)}")
             logger.error(f"Response content: {response[:500]}...")
             raise e
@@ -223,8 +223,6 @@ IMPORTANT: You must respond with ONLY a valid JSON object. Do not include any te
         Creates only ONE chunk per URL with comprehensive content
         """
         try:
-            from app.config.settings import MAX_TOTAL_CHUNKS_CHARACTERS, MAX_CHUNK_CHARACTERS, MAX_CHUNKS_PER_URL
-            
             scraped_content_list = scraped_data.get("scraped_content", [])
             all_chunks = []
             total_characters = 0
@@ -272,3 +270,9 @@ IMPORTANT: You must respond with ONLY a valid JSON object. Do not include any te
         except Exception as e:
             logger.error(f"Error generating chunks from scraped data: {str(e)}")
             raise e
+
+
+@lru_cache(maxsize=1)
+def get_openai_service() -> OpenAIService:
+    """Process-wide OpenAIService so the OpenAI client's connection pool is reused"""
+    return OpenAIService()
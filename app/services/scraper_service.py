@@ -9,6 +9,7 @@ from urllib.parse import urljoin, urlparse
 from typing import List, Dict, Any, Set, Optional
 from datetime import datetime
 import re
+import orjson
 from app.schemas.scraper import ScrapedContent
 
 logger = logging.getLogger(__name__)
@@ -408,8 +409,7 @@ class WebScraperService:
 
                 result = await Runner.run(agent, url)
 
-            print(result.final_output)
-            print(result)
+            logger.debug("Extraction agent output for %s: %s", url, result.final_output)
             text = (result.final_output or "").strip()
             if text.startswith("```"):
                 # Strip Markdown fences
@@ -418,8 +418,7 @@ class WebScraperService:
                 else:
                     text = text.strip("`\n")
 
-            import json as _json
-            parsed = _json.loads(text)
+            parsed = orjson.loads(text)
 
             # Safety fallback values
             title = parsed.get("title") or ""
@@ -1,6 +1,11 @@
-import os, httpx, json, logging
+import os, httpx, json, logging, asyncio
 from app.database_operations import get_supabase_client
-from typing import Optional, List
+from app.database import run_supabase_async
+from app.db.pool import get_pg_pool
+from typing import Optional, List, Dict, Any, Tuple
+
+# Max concurrent file uploads to VAPI (keeps us under their rate limits)
+VAPI_UPLOAD_CONCURRENCY = 8
 
 logger = logging.getLogger(__name__)
 
@@ -73,17 +78,87 @@ async def upload_chunk_to_vapi(
             if response.status_code in [200, 201]:
                 result = response.json()
                 file_id = result.get('id')
-                logger.info(f"Successfully uploaded chunk {chunk_id} to VAPI, file_id: {file_id}")
+                logger.info("Successfully uploaded chunk %s to VAPI, file_id: %s", chunk_id, file_id)
                 return file_id
             else:
-                logger.error(f"Failed to upload chunk to VAPI: {response.status_code} - {response.text}")
+                logger.error("Failed to upload chunk to VAPI: %s - %s", response.status_code, response.text)
                 return None
                 
     except Exception as e:
-        logger.error(f"Error uploading chunk to VAPI: {str(e)}")
+        logger.error("Error uploading chunk to VAPI: %s", e)
         return None
 
 
+async def store_vapi_file_ids(pairs: List[Tuple[str, str]]) -> None:
+    """Persist (chunk_id, vapi_file_id) pairs in a single UPDATE."""
+    if not pairs:
+        return
+    pool = await get_pg_pool()
+    await pool.execute(
+        "UPDATE chunks SET vapi_file_id = data.vid "
+        "FROM unnest($1::uuid[], $2::text[]) AS data(id, vid) "
+        "WHERE chunks.id = data.id",
+        [chunk_id for chunk_id, _ in pairs],
+        [vapi_file_id for _, vapi_file_id in pairs],
+    )
+
+
+async def _store_vapi_file_ids_per_row(pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Store file IDs with one Supabase update per chunk; returns the pairs that failed."""
+    supabase = get_supabase_client()
+
+    async def _store_one(chunk_id: str, vapi_file_id: str) -> None:
+        await run_supabase_async(
+            lambda: supabase.table("chunks").update({"vapi_file_id": vapi_file_id}).eq("id", chunk_id).execute()
+        )
+
+    results = await asyncio.gather(*[_store_one(*pair) for pair in pairs], return_exceptions=True)
+    return [pair for pair, result in zip(pairs, results) if isinstance(result, Exception)]
+
+
+async def upload_chunks_to_vapi(saved_chunks: List[Dict[str, Any]]) -> int:
+    """
+    Upload saved chunk rows to VAPI concurrently and store the returned file IDs.
+
+    Uploads are bounded by VAPI_UPLOAD_CONCURRENCY; the resulting file IDs are
+    written back with one batched UPDATE once all uploads have finished. If the
+    Postgres pool is unavailable they are stored row by row through Supabase.
+
+    Returns:
+        Number of chunks that were uploaded successfully
+    """
+    sem = asyncio.Semaphore(VAPI_UPLOAD_CONCURRENCY)
+
+    async def _upload_one(chunk: Dict[str, Any]) -> Optional[str]:
+        async with sem:
+            return await upload_chunk_to_vapi(
+                chunk["id"],
+                chunk.get("name", "Unnamed Chunk"),
+                chunk.get("content", ""),
+                bullets=chunk.get("bullets", []),
+                sample_questions=chunk.get("sample_questions", []),
+            )
+
+    results = await asyncio.gather(*[_upload_one(c) for c in saved_chunks], return_exceptions=True)
+    pairs: List[Tuple[str, str]] = []
+    for chunk, result in zip(saved_chunks, results):
+        if isinstance(result, Exception):
+            logger.warning("Upload chunk %s failed: %s", chunk.get('id'), result)
+        elif result:
+            pairs.append((chunk["id"], result))
+
+    try:
+        await store_vapi_file_ids(pairs)
+    except Exception as e:
+        logger.warning("Batched VAPI file ID update failed, storing %d rows through Supabase: %s", len(pairs), e)
+        failed = await _store_vapi_file_ids_per_row(pairs)
+        if failed:
+            logger.error(
+                "VAPI files uploaded but not stored on their chunks (chunk_id, vapi_file_id): %s", failed
+            )
+    return len(pairs)
+
+
 async def delete_file_from_vapi(vapi_file_id: str) -> bool:
     """
     Delete a file from VAPI knowledge base.
@@ -107,17 +182,17 @@ async def delete_file_from_vapi(vapi_file_id: str) -> bool:
             )
             
             if response.status_code in [200, 204]:
-                logger.info(f"Successfully deleted file {vapi_file_id} from VAPI")
+                logger.info("Successfully deleted file %s from VAPI", vapi_file_id)
                 return True
             elif response.status_code == 404:
-                logger.info(f"File {vapi_file_id} not found in VAPI (already deleted)")
+                logger.info("File %s not found in VAPI (already deleted)", vapi_file_id)
                 return True  # Consider this a success
             else:
-                logger.error(f"Failed to delete file from VAPI: {response.status_code} - {response.text}")
+                logger.error("Failed to delete file from VAPI: %s - %s", response.status_code, response.text)
                 return False
                 
     except Exception as e:
-        logger.error(f"Error deleting file from VAPI: {str(e)}")
+        logger.error("Error deleting file from VAPI: %s", e)
         return False
 
 
@@ -209,9 +284,9 @@ Out-of-scope response (template):
             "provider": "canonical",  # VAPI's default provider
             "fileIds": file_ids
         }
-        logger.info(f"Syncing assistant {assistant_id} with {len(file_ids)} knowledge base files")
+        logger.info("Syncing assistant %s with %d knowledge base files", assistant_id, len(file_ids))
     else:
-        logger.info(f"No knowledge base files found for receptionist {receptionist_id}")
+        logger.info("No knowledge base files found for receptionist %s", receptionist_id)
 
     try:
         async with httpx.AsyncClient(timeout=30) as client:
@@ -222,11 +297,11 @@ Out-of-scope response (template):
             )
             
             if response.status_code in [200, 201]:
-                logger.info(f"Successfully synced assistant {assistant_id}")
+                logger.info("Successfully synced assistant %s", assistant_id)
             else:
-                logger.error(f"Failed to sync assistant: {response.status_code} - {response.text}")
+                logger.error("Failed to sync assistant: %s - %s", response.status_code, response.text)
     except Exception as e:
-        logger.error(f"Error syncing assistant: {str(e)}")
+        logger.error("Error syncing assistant: %s", e)
 
 
 def build_assistant_payload(org_name: str, receptionist_name: str, voice_id: str, first_message: str | None = None, **overrides):
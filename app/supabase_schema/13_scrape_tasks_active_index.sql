@@ -0,0 +1,8 @@
+-- Migration: Partial index for the /scraper/active-task lookup
+-- Only queued / in_progress rows are indexed, so the index stays tiny and the
+-- "latest active task for org (and receptionist)" query is a single index scan.
+-- CONCURRENTLY avoids locking scrape_tasks; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS scrape_tasks_active_idx
+    ON scrape_tasks (organization_id, receptionist_id, created_at DESC)
+    WHERE status IN ('queued', 'in_progress');
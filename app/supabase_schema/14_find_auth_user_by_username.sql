@@ -0,0 +1,29 @@
+-- Migration: Username lookup for sign-in / sign-up
+-- Usernames live in auth.users.raw_user_meta_data, which GoTrue's admin API
+-- can't filter on, so the backend used to page through /admin/users and scan
+-- in Python. This function does the match inside Postgres and returns the one
+-- user in the same shape GoTrue uses (id, email, user_metadata, timestamps).
+-- Called via PostgREST: POST /rest/v1/rpc/find_auth_user_by_username
+
+CREATE OR REPLACE FUNCTION public.find_auth_user_by_username(p_username TEXT)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER              -- auth.users is not readable by API roles
+SET search_path = public
+AS $$
+  SELECT jsonb_build_object(
+    'id', u.id,
+    'email', u.email,
+    'user_metadata', u.raw_user_meta_data,
+    'created_at', u.created_at,
+    'updated_at', u.updated_at
+  )
+  FROM auth.users u
+  WHERE u.raw_user_meta_data->>'username' = p_username
+  LIMIT 1;
+$$;
+
+-- Only the backend (service role) may look users up
+REVOKE EXECUTE ON FUNCTION public.find_auth_user_by_username(TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.find_auth_user_by_username(TEXT) TO service_role;
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List
 
 from app.celery_app import celery_app
 from app.services.scraper_service import WebScraperService
-from app.services.openai_service import OpenAIService
+from app.services.openai_service import get_openai_service
 from app.database_operations import get_supabase_client
-from app.services.vapi_assistant import upload_chunk_to_vapi, sync_assistant_prompt
+from app.services.vapi_assistant import upload_chunks_to_vapi, sync_assistant_prompt
+from app.db.pool import task_pg_pool
 
 logger = logging.getLogger(__name__)
 
-@celery_app.task(bind=True, name="app.tasks.scrape_tasks.scrape_website", autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+@celery_app.task(bind=True, name="app.tasks.scrape_tasks.scrape_website", autoretry_for=(Exception,), retry_backoff=True, max_retries=3, ignore_result=True)
 def scrape_website(self, task_id: str, url: str, receptionist_id: str | None, organization_id: str, max_depth: int = 3,
                    include_subdomains: bool = True, include_subpages: bool = True, notify_email: str | None = None, **_kwargs) -> dict:
     """Background Celery task that performs full scrape + chunk pipeline."""
 
-    start_ts = datetime.utcnow().isoformat()
+    start_ts = datetime.now(timezone.utc).isoformat()
     supabase = get_supabase_client()
 
     # update task row status -> in_progress
@@ -50,10 +51,18 @@ def scrape_website(self, task_id: str, url: str, receptionist_id: str | None, or
         scraped_content.extend(asyncio.run(run_scrape()))
         publish("Content collection finished, preparing knowledge files…")
 
+        # Single pass over the pages: count them and dump only the successful
+        # ones (chunk generation skips non-200 pages anyway)
+        successful_pages = []
+        for content in scraped_content:
+            if content.status_code == 200:
+                successful_pages.append(content.model_dump())
+        logger.info("Scraped %d pages (%d successful) for task %s", len(scraped_content), len(successful_pages), task_id)
+
         # Generate chunks
-        openai_service = OpenAIService()
+        openai_service = get_openai_service()
         chunks = asyncio.run(openai_service.generate_chunks_from_scraped_data(
-            scraped_data={"scraped_content": [c.model_dump() for c in scraped_content]},
+            scraped_data={"scraped_content": successful_pages},
             organization_id=str(organization_id),
         ))
         if chunks:
@@ -65,20 +74,22 @@ def scrape_website(self, task_id: str, url: str, receptionist_id: str | None, or
             saved_chunks = res.data or []
 
         publish(f"Uploading {len(saved_chunks)} knowledge files …")
-        for saved_chunk in saved_chunks:
+        if saved_chunks:
+            async def _upload_chunks():
+                # Pool lives and dies inside this asyncio.run loop; without one the
+                # file IDs are stored through Supabase instead
+                async with task_pg_pool():
+                    return await upload_chunks_to_vapi(saved_chunks)
+
+            # The chunks are already inserted, so an upload failure must not fail
+            # the task: autoretry would rerun the scrape and insert them again
             try:
-                cid = saved_chunk["id"]
-                vapi_file_id = asyncio.run(upload_chunk_to_vapi(
-                    cid,
-                    saved_chunk.get("name", "Unnamed Chunk"),
-                    saved_chunk.get("content", ""),
-                    bullets=saved_chunk.get("bullets", []),
-                    sample_questions=saved_chunk.get("sample_questions", []),
-                ))
-                if vapi_file_id:
-                    supabase.table("chunks").update({"vapi_file_id": vapi_file_id}).eq("id", cid).execute()
-            except Exception as exc:
-                logger.warning(f"Upload chunk failed: {exc}")
+                uploaded = asyncio.run(_upload_chunks())
+            except Exception as e:
+                logger.warning("VAPI upload failed for task %s: %s", task_id, e)
+                uploaded = 0
+            if uploaded < len(saved_chunks):
+                logger.warning("Only %d of %d chunks uploaded to VAPI for task %s", uploaded, len(saved_chunks), task_id)
 
         if receptionist_id:
             rec = supabase.table("receptionists").select("assistant_id").eq("id", receptionist_id).single().execute()
@@ -101,9 +112,9 @@ def scrape_website(self, task_id: str, url: str, receptionist_id: str | None, or
                 from app.utils.email_sendgrid import send_scrape_complete_email
                 _asyncio.run(send_scrape_complete_email(notify_email, context))
         except Exception as mail_exc:
-            logger.warning(f"Failed to send completion email: {mail_exc}")
+            logger.warning("Failed to send completion email: %s", mail_exc)
 
-        supabase.table("scrape_tasks").update({"status": "completed", "completed_at": datetime.utcnow().isoformat()}).eq("id", task_id).execute()
+        supabase.table("scrape_tasks").update({"status": "completed", "completed_at": datetime.now(timezone.utc).isoformat()}).eq("id", task_id).execute()
         return {"chunks": len(saved_chunks)}
     except Exception as exc:
         logger.exception("Scrape failed")
@@ -3,9 +3,13 @@ Utility modules for the AI Receptionist API
 """
 
 from .auth import (
-    get_current_user
+    get_current_user,
+    require_valid_token,
+    require_org
 )
 
 __all__ = [
-    "get_current_user"
+    "get_current_user",
+    "require_valid_token",
+    "require_org"
 ] 
\ No newline at end of file
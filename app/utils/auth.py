@@ -5,6 +5,7 @@ Common authentication utilities for the AI Receptionist API
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer
 from app.services.auth_service import AuthService
+from app.database_operations import get_user_organization
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,12 +33,10 @@ async def get_current_user(authorization: str = Depends(http_bearer)):
         # Verify the token
         auth_service = AuthService()
         user = await auth_service.verify_token(token)
-        logger.info(f"User authenticated: {user.get('claims').get('email', 'unknown')}")
+        logger.debug("User authenticated: %s", user.get('claims').get('email', 'unknown'))
 
         # Get user's organization information
         try:
-            from app.database_operations import get_user_organization, ensure_user_organization
-            
             # Get user's organization from metadata (pass claims for efficiency)
             user_org = await get_user_organization(user.get('claims').get('sub'), user.get('claims'))
             if not user_org:
@@ -46,7 +45,7 @@ async def get_current_user(authorization: str = Depends(http_bearer)):
             # Add organization info to user claims
             if user_org:
                 user['claims']['organization'] = user_org
-                logger.info(f"User {user.get('claims').get('email')} belongs to organization: {user_org.get('name')}")
+                logger.debug("User %s belongs to organization: %s", user.get('claims').get('email'), user_org.get('name'))
             else:
                 logger.warning(f"Could not determine organization for user {user.get('claims').get('email')}")
                 
@@ -62,3 +61,43 @@ async def get_current_user(authorization: str = Depends(http_bearer)):
             status_code=401,
             detail=f"Invalid or expired token. Please sign in again. Authentication failed: {str(e)}"
         )
+
+
+async def require_valid_token(authorization: str = Depends(http_bearer)) -> dict:
+    """
+    Lightweight authentication dependency that only verifies the JWT
+
+    Checks signature and expiry locally without the organization lookup done by
+    get_current_user. Use it on endpoints that serve the same data to every
+    authenticated caller.
+
+    Returns:
+        dict: Claims from the verified JWT token
+
+    Raises:
+        HTTPException: 401 if token is invalid, expired, or missing
+    """
+    token = AuthService.get_token_from_header(authorization.credentials)
+    result = await AuthService().verify_token(token)
+    if not result.get("valid"):
+        raise HTTPException(
+            status_code=401,
+            detail=f"Invalid or expired token. Please sign in again. {result.get('message', '')}".strip()
+        )
+    return result["claims"]
+
+
+async def require_org(current_user: dict = Depends(get_current_user)) -> str:
+    """
+    Dependency that resolves the caller's organization id
+
+    Returns:
+        str: Organization id from the authenticated user's claims
+
+    Raises:
+        HTTPException: 400 if the user has no organization
+    """
+    organization_id = (current_user.get("organization") or {}).get("id")
+    if not organization_id:
+        raise HTTPException(status_code=400, detail="User has no organization")
+    return organization_id
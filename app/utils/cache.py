@@ -0,0 +1,50 @@
+"""Response caching for read-only GET endpoints.
+
+Backed by ``fastapi-cache2`` with the same Redis instance Celery uses. Keys are
+scoped to the caller's organization so one tenant never sees another's cached
+payload.
+"""
+
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from app.utils.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "recapi"
+
+
+def org_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build a cache key from ``(organization_id, path, query)``.
+
+    ``namespace`` arrives already prefixed (``recapi:<namespace>``), so keys
+    line up with what ``FastAPICache.clear(namespace=...)`` deletes.
+    """
+    kwargs = kwargs or {}
+    org_id = kwargs.get("organization_id")
+    if not org_id:
+        current_user = kwargs.get("current_user") or {}
+        org_id = (current_user.get("organization") or {}).get("id") or "anon"
+    path = request.url.path if request else func.__qualname__
+    query = request.url.query if request else ""
+    digest = hashlib.md5(f"{path}?{query}".encode()).hexdigest()
+    return f"{namespace}:{org_id}:{digest}"
+
+
+def init_cache() -> None:
+    """Initialise the Redis cache backend. Call once at app startup."""
+    FastAPICache.init(RedisBackend(redis_client), prefix=CACHE_PREFIX, key_builder=org_key_builder)
+    logger.info("Response cache initialised (prefix=%s)", CACHE_PREFIX)
@@ -0,0 +1,18 @@
+"""Shared asyncio Redis client for request handlers.
+
+Connections come from one bounded pool and are kept alive between requests.
+Long-lived pub/sub listeners (see ``app/api/v1/progress.py``) use a separate
+pool so they can't starve this one.
+"""
+
+from redis.asyncio import Redis
+
+from app.config.settings import REDIS_URL
+
+redis_client = Redis.from_url(REDIS_URL, max_connections=32, socket_keepalive=True)
+
+
+async def close_redis_client() -> None:
+    """Close the shared client's connections (called on app shutdown)."""
+    await redis_client.close()
+    await redis_client.connection_pool.disconnect()
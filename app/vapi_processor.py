@@ -3,10 +3,11 @@ VAPI Data Processor
 Handles processing of VAPI API responses and updates database accordingly
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from app.database import get_supabase_client
+from app.database import get_supabase_client, run_supabase_async
 from app.config.settings import VAPI_AUTH_TOKEN
 
 logger = logging.getLogger(__name__)
@@ -67,6 +68,116 @@ def process_vapi_calls_response(vapi_response: List[Dict[str, Any]]) -> Dict[str
         }
 
 
+# Most row updates _apply_updates keeps in flight at once, so one big sync
+# can't take over the shared thread pool
+UPDATE_CONCURRENCY = 8
+
+
+async def _existing_vapi_calls(supabase, table_name: str, calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Look up which of the given VAPI calls already have a row, in one query
+    
+    Returns:
+        Mapping of vapi_call_id to the existing row (id, updated_at)
+    """
+    call_ids = list({call["id"] for call in calls if call.get("id")})
+    if not call_ids:
+        return {}
+    result = await run_supabase_async(
+        lambda: supabase.table(table_name).select("id, vapi_call_id, updated_at").in_("vapi_call_id", call_ids).execute()
+    )
+    existing = {}
+    for row in result.data or []:
+        existing.setdefault(row["vapi_call_id"], row)
+    return existing
+
+
+async def _apply_updates(supabase, table_name: str, key_column: str, updates: List[tuple]) -> List[Any]:
+    """
+    Run row updates concurrently on the shared thread pool instead of one
+    round-trip after another, at most UPDATE_CONCURRENCY at a time. Each
+    update targets a different row, so their relative order doesn't matter.
+    
+    Args:
+        updates: (key, fields) pairs; key is matched against key_column
+        
+    Returns:
+        Per-update result: True if a row was updated, False if none matched,
+        or the exception raised
+    """
+    semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
+    
+    async def apply(key, fields):
+        async with semaphore:
+            result = await run_supabase_async(
+                lambda: supabase.table(table_name).update(fields).eq(key_column, key).execute()
+            )
+        return bool(result.data)
+    
+    return await asyncio.gather(*(apply(key, fields) for key, fields in updates), return_exceptions=True)
+
+
+async def _insert_calls(supabase, table_name: str, rows: List[Dict[str, Any]], label: str) -> Tuple[int, List[str]]:
+    """
+    Insert new call rows in one request, falling back to one insert per row
+    if the batch fails so a single bad call only costs its own row. Rows are
+    deduplicated by vapi_call_id first (the last copy in the page wins).
+    
+    Args:
+        label: "inbound" or "outbound", for error messages
+        
+    Returns:
+        (inserted_count, errors)
+    """
+    rows = list({row["vapi_call_id"]: row for row in rows}.values())
+    try:
+        result = await run_supabase_async(
+            lambda: supabase.table(table_name).insert(rows).execute()
+        )
+        inserted_count = len(result.data or [])
+        if inserted_count < len(rows):
+            return inserted_count, [f"Inserted {inserted_count} of {len(rows)} new {label} calls"]
+        return inserted_count, []
+    except Exception as batch_error:
+        logger.warning(f"Batch insert of {len(rows)} {label} calls failed, inserting one by one: {str(batch_error)}")
+    
+    semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
+    
+    async def insert_one(row):
+        async with semaphore:
+            result = await run_supabase_async(
+                lambda: supabase.table(table_name).insert(row).execute()
+            )
+        return bool(result.data)
+    
+    results = await asyncio.gather(*(insert_one(row) for row in rows), return_exceptions=True)
+    inserted_count = 0
+    errors = []
+    for row, outcome in zip(rows, results):
+        if outcome is True:
+            inserted_count += 1
+        elif isinstance(outcome, Exception):
+            error_msg = f"Failed to insert {label} call {row['vapi_call_id']}: {str(outcome)}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+        else:
+            errors.append(f"Failed to insert {label} call {row['vapi_call_id']}")
+    return inserted_count, errors
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _is_unchanged(existing_row: Dict[str, Any], call: Dict[str, Any]) -> bool:
+    """True if the stored row already reflects the call's latest VAPI update"""
+    stored = _parse_timestamp(existing_row.get("updated_at"))
+    return stored is not None and stored == _parse_timestamp(call.get("updatedAt"))
+
+
 async def update_inbound_calls_database(inbound_calls: List[Dict[str, Any]], organization_id: str) -> Dict[str, Any]:
     """
     Update inbound calls in the database
@@ -85,6 +196,11 @@ async def update_inbound_calls_database(inbound_calls: List[Dict[str, Any]], org
         updated_count = 0
         inserted_count = 0
         errors = []
+        # New rows are collected and inserted in one request after the loop
+        pending_inserts = []
+        pending_updates = []
+        existing_calls = await _existing_vapi_calls(supabase, table_name, inbound_calls)
+        unchanged_count = 0
         
         for call in inbound_calls:
             try:
@@ -92,8 +208,10 @@ async def update_inbound_calls_database(inbound_calls: List[Dict[str, Any]], org
                 if not call_id:
                     continue
                 
-                # Check if call already exists
-                existing_call = supabase.table(table_name).select("id").eq("vapi_call_id", call_id).execute()
+                # Skip calls whose stored row is already at VAPI's latest update
+                if call_id in existing_calls and _is_unchanged(existing_calls[call_id], call):
+                    unchanged_count += 1
+                    continue
                 
                 # Extract customer information
                 customer = call.get("customer", {})
@@ -124,31 +242,36 @@ async def update_inbound_calls_database(inbound_calls: List[Dict[str, Any]], org
                 
 
                 
-                if existing_call.data:
-                    # Update existing call
-                    result = supabase.table(table_name).update(call_data).eq("vapi_call_id", call_id).execute()
-                    if result.data:
-                        updated_count += 1
-                        logger.info(f"Updated inbound call: {call_id}")
-                    else:
-                        errors.append(f"Failed to update inbound call: {call_id}")
+                if call_id in existing_calls:
+                    # Queue update of existing call
+                    pending_updates.append((call_id, call_data))
                 else:
-                    # Insert new call
+                    # Queue new call for the batch insert
                     call_data["created_at"] = datetime.utcnow().isoformat()
-                    
-                    result = supabase.table(table_name).insert(call_data).execute()
-                    if result.data:
-                        inserted_count += 1
-                        logger.info(f"Inserted new inbound call: {call_id}")
-                    else:
-                        errors.append(f"Failed to insert inbound call: {call_id}")
+                    pending_inserts.append(call_data)
                         
             except Exception as call_error:
                 error_msg = f"Error processing inbound call {call.get('id', 'unknown')}: {str(call_error)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
         
-        logger.info(f"Inbound calls processed: {updated_count} updated, {inserted_count} inserted")
+        update_results = await _apply_updates(supabase, table_name, "vapi_call_id", pending_updates)
+        for (call_id, _), outcome in zip(pending_updates, update_results):
+            if outcome is True:
+                updated_count += 1
+                logger.info(f"Updated inbound call: {call_id}")
+            elif isinstance(outcome, Exception):
+                error_msg = f"Error processing inbound call {call_id}: {str(outcome)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+            else:
+                errors.append(f"Failed to update inbound call: {call_id}")
+        
+        if pending_inserts:
+            inserted_count, insert_errors = await _insert_calls(supabase, table_name, pending_inserts, "inbound")
+            errors.extend(insert_errors)
+        
+        logger.info(f"Inbound calls processed: {updated_count} updated, {inserted_count} inserted, {unchanged_count} unchanged")
         
         return {
             "updated_count": updated_count,
@@ -185,6 +308,14 @@ async def update_outbound_calls_database(outbound_calls: List[Dict[str, Any]], o
         updated_count = 0
         inserted_count = 0
         errors = []
+        # New rows are collected and inserted in one request after the loop
+        pending_inserts = []
+        pending_updates = []
+        # (vapi call id, phone) per queued update, for logging
+        update_labels = []
+        # Existing rows by vapi_call_id, so the same VAPI call never gets a duplicate record
+        existing_records = await _existing_vapi_calls(supabase, table_name, outbound_calls)
+        unchanged_count = 0
         
         for call in outbound_calls:
             try:
@@ -192,6 +323,11 @@ async def update_outbound_calls_database(outbound_calls: List[Dict[str, Any]], o
                 if not call_id:
                     continue
                 
+                # Skip calls whose stored row is already at VAPI's latest update
+                if call_id in existing_records and _is_unchanged(existing_records[call_id], call):
+                    unchanged_count += 1
+                    continue
+                
                 # Extract customer information
                 customer = call.get("customer", {})
                 customer_number = customer.get("number", "")
@@ -200,10 +336,6 @@ async def update_outbound_calls_database(outbound_calls: List[Dict[str, Any]], o
                 first_name = customer.get("firstName")  # Will be None if not present
                 last_name = customer.get("lastName")    # Will be None if not present
                 
-                # Check if call already exists by vapi_call_id
-                # This ensures we don't create duplicate records for the same VAPI call
-                existing_call = supabase.table(table_name).select("id").eq("vapi_call_id", call_id).execute()
-                
                 # Prepare call data matching the actual leads table schema
                 call_data = {
                     "organization_id": organization_id,  # Required field
@@ -223,9 +355,10 @@ async def update_outbound_calls_database(outbound_calls: List[Dict[str, Any]], o
                     "success_evaluation": call.get("analysis", {}).get("successEvaluation", "")
                 }
                 
-                if existing_call.data:
+                existing_record = existing_records.get(call_id)
+                if existing_record:
                     # Update existing call - only update fields that exist in the table
-                    existing_record_id = existing_call.data[0]["id"]
+                    existing_record_id = existing_record["id"]
                     assistant_id = call.get("assistantId")
 
                     update_fields = {
@@ -244,28 +377,34 @@ async def update_outbound_calls_database(outbound_calls: List[Dict[str, Any]], o
                         "success_evaluation": call.get("analysis", {}).get("successEvaluation", "")
                     }
                     
-                    result = supabase.table(table_name).update(update_fields).eq("id", existing_record_id).execute()
-                    if result.data:
-                        updated_count += 1
-                        logger.info(f"Updated outbound call {call_id} for phone: {customer_number}")
-                    else:
-                        errors.append(f"Failed to update outbound call {call_id} for phone: {customer_number}")
+                    pending_updates.append((existing_record_id, update_fields))
+                    update_labels.append((call_id, customer_number))
                 else:
-                    # Insert new call
-                    
-                    result = supabase.table(table_name).insert(call_data).execute()
-                    if result.data:
-                        inserted_count += 1
-                        logger.info(f"Inserted new outbound call {call_id} for phone: {customer_number}")
-                    else:
-                        errors.append(f"Failed to insert outbound call {call_id} for phone: {customer_number}")
+                    # Queue new call for the batch insert
+                    pending_inserts.append(call_data)
                         
             except Exception as call_error:
                 error_msg = f"Error processing outbound call {call.get('id', 'unknown')}: {str(call_error)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
         
-        logger.info(f"Outbound calls processed: {updated_count} updated, {inserted_count} inserted")
+        update_results = await _apply_updates(supabase, table_name, "id", pending_updates)
+        for (call_id, customer_number), outcome in zip(update_labels, update_results):
+            if outcome is True:
+                updated_count += 1
+                logger.info(f"Updated outbound call {call_id} for phone: {customer_number}")
+            elif isinstance(outcome, Exception):
+                error_msg = f"Error processing outbound call {call_id}: {str(outcome)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+            else:
+                errors.append(f"Failed to update outbound call {call_id} for phone: {customer_number}")
+        
+        if pending_inserts:
+            inserted_count, insert_errors = await _insert_calls(supabase, table_name, pending_inserts, "outbound")
+            errors.extend(insert_errors)
+        
+        logger.info(f"Outbound calls processed: {updated_count} updated, {inserted_count} inserted, {unchanged_count} unchanged")
         
         return {
             "updated_count": updated_count,
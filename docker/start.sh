@@ -11,11 +11,11 @@ sleep 2
 
 # Start Celery worker in background
 cd /src
-celery -A app.celery_app worker --loglevel=info --concurrency=2 &
+CELERY_WORKER_RUNNING=1 celery -A app.celery_app worker --loglevel=info --concurrency=2 &
 CELERY_PID=$!
 
 # Start FastAPI server (this will be the main process)
-python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 2
+python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 2 --loop uvloop --http httptools
 
 # If FastAPI exits, kill Celery
 kill $CELERY_PID
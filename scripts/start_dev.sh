@@ -29,6 +29,7 @@ if [ ! -f ".env" ]; then
     echo "  - AI_RECEPTION_SUPABASE_KEY"
     echo "  - AI_RECEPTION_SUPABASE_SERVICE_ROLE_KEY"
     echo "  - AI_RECEPTION_SUPABASE_JWT_SECRET"
+    echo "  - AI_RECEPTION_DATABASE_URL"
     echo "  - SECRET_KEY"
     echo ""
 fi